@@ -11,4 +11,4 @@ __email__ = "mail@polaz.com"
 
 from .server import main
 
-__all__ = ["main"]
+__all__ = ("main",)
@@ -21,4 +21,4 @@ except ImportError as e:
     print(f"Python path: {sys.path}")
     sys.exit(1)
 
-__all__ = ["main"]
+__all__ = ("main",)
@@ -15,7 +15,8 @@ sys.path.insert(0, str(current_dir))
 # Change to the correct working directory
 os.chdir(current_dir)
 
-# Import and run the server
+# Import and run the server through the same entry point as the package script
 if __name__ == "__main__":
-    import server
-    server.mcp.run(transport="stdio")
+    from server import main
+
+    main()
@@ -11,10 +11,13 @@ License: MIT
 """
 
 import asyncio
+import importlib.util
 import os
 import sys
 import threading
 
+import anyio
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -24,6 +27,11 @@ except ImportError:
 
 from mcp.server.fastmcp import FastMCP
 
+from src.api.graphql_client import (
+    GitLabGraphQLClientSingleton,
+    close_shared_pool,
+    get_graphql_client,
+)
 from src.schemas.search import GlobalSearchRequest, GroupSearchRequest
 from src.services.branches import (
     create_branch,
@@ -81,6 +89,19 @@ async def init_server():
         print(f"✅ Initialized {len(type_mappings)} work item types")
     except Exception as e:
         print(f"⚠️ Work item type initialization failed: {e}. Using fallback types.")
+    finally:
+        # Release the GraphQL session and pool of this short-lived loop only;
+        # those already opened by tool calls on the stdio loop stay connected
+        await get_graphql_client().close()
+        await close_shared_pool()
+
+
+async def serve_stdio():
+    """Serve MCP over stdio, releasing pooled GraphQL connections on shutdown."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await GitLabGraphQLClientSingleton.close_singleton()
 
 # Initialize server startup hook
 def run_init():
@@ -790,7 +811,9 @@ def main():
     # Debug output for API URL (always show for debugging)
     print(f"Debug: Using GitLab API URL: {api_url}", file=sys.stderr)
 
-    mcp.run(transport="stdio")
+    # Prefer uvloop for the stdio loop when installed (it is not available on Windows)
+    backend_options = {"use_uvloop": importlib.util.find_spec("uvloop") is not None}
+    anyio.run(serve_stdio, backend_options=backend_options)
 
 
 # Run the server
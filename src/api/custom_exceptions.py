@@ -54,11 +54,19 @@ class GitLabAPIError(Exception):
         self.details = details or {}
         self.code = code
 
-        message = self.ERROR_MESSAGES[error_type]
-        if details:
-            message = f"{message}: {details}"
+        # Only the base message is stored; details are formatted lazily in __str__
+        super().__init__(self.ERROR_MESSAGES[error_type])
 
-        super().__init__(message)
+    def __str__(self) -> str:
+        """Format the error message with its details.
+
+        Returns:
+            The standard message for the error type, followed by any details.
+        """
+        message = self.ERROR_MESSAGES[self.error_type]
+        if self.details:
+            return f"{message}: {self.details}"
+        return message
 
     @classmethod
     def from_response(
@@ -87,6 +95,43 @@ class GitLabAPIError(Exception):
 
         return cls(error_type, error_details, code=response.status_code)
 
+    @classmethod
+    def for_operation(
+        cls,
+        error_type: GitLabErrorType,
+        operation: str,
+        message: str,
+        cause: Exception | None = None,
+    ) -> "GitLabAPIError":
+        """Create an error for a failed service operation.
+
+        Args:
+            error_type: The type of error that occurred.
+            operation: Name of the service operation that failed.
+            message: Human-readable description of the failure.
+            cause: The underlying exception, whose HTTP status code is kept.
+
+        Returns:
+            A GitLabAPIError instance.
+        """
+        return cls(
+            error_type,
+            {"message": message, "operation": operation},
+            code=_code_of(cause),
+        )
+
+
+def _code_of(cause: Exception | None) -> int | None:
+    """Return the HTTP status code carried by a GitLab error cause, if any.
+
+    Args:
+        cause: The exception being wrapped.
+
+    Returns:
+        The status code of a GitLabAPIError cause, otherwise None.
+    """
+    return cause.code if isinstance(cause, GitLabAPIError) else None
+
 
 class GitLabAuthError(GitLabAPIError):
     """Raised when GitLab authentication fails."""
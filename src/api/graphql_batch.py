@@ -0,0 +1,138 @@
+"""Merging of independent GraphQL queries into a single batched operation.
+
+Queries are combined by prefixing every top-level response key with an alias
+and every variable with a per-query prefix, so that one HTTP request can serve
+several callers. Only plain query operations without fragment definitions are
+merged; anything else is left for individual execution.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    NameNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+    VariableNode,
+    Visitor,
+    visit,
+)
+
+BATCH_OPERATION_NAME = "Batch"
+
+
+@dataclass(frozen=True, slots=True)
+class MergedQuery:
+    """A batched operation and the information needed to split its result."""
+
+    document: DocumentNode
+    variables: dict[str, Any]
+    # For each merged query, pairs of (original response key, batched alias)
+    response_keys: tuple[tuple[tuple[str, str], ...], ...]
+
+    def split(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Split batched response data into per-query results.
+
+        Args:
+            data: The data of the batched response.
+
+        Returns:
+            list[dict[str, Any]]: One result per merged query, in input order.
+        """
+        return [
+            {key: data[alias] for key, alias in keys if alias in data}
+            for keys in self.response_keys
+        ]
+
+
+class _VariablePrefixer(Visitor):
+    """AST visitor that renames every variable with a fixed prefix."""
+
+    def __init__(self, prefix: str) -> None:
+        super().__init__()
+        self.prefix = prefix
+
+    def enter_variable(self, node: VariableNode, *_: Any) -> VariableNode:
+        return VariableNode(name=NameNode(value=f"{self.prefix}{node.name.value}"))
+
+
+def get_batchable_operation(document: DocumentNode) -> OperationDefinitionNode | None:
+    """Return the document's query operation if it can be merged with others.
+
+    Args:
+        document: A parsed GraphQL document.
+
+    Returns:
+        OperationDefinitionNode | None: The operation, or None if the document
+        is a mutation/subscription, uses fragment definitions, has operation
+        directives, or selects anything other than plain top-level fields.
+    """
+    if len(document.definitions) != 1:
+        return None
+    operation = document.definitions[0]
+    if (
+        not isinstance(operation, OperationDefinitionNode)
+        or operation.operation != OperationType.QUERY
+        or operation.directives
+    ):
+        return None
+    if not all(isinstance(s, FieldNode) for s in operation.selection_set.selections):
+        return None
+    return operation
+
+
+def merge_queries(
+    queries: list[tuple[OperationDefinitionNode, dict[str, Any] | None]],
+) -> MergedQuery:
+    """Merge batchable query operations into a single operation.
+
+    Args:
+        queries: Pairs of (operation from get_batchable_operation, variables).
+
+    Returns:
+        MergedQuery: The combined document, variables and response key mapping.
+    """
+    variable_definitions = []
+    selections = []
+    variables: dict[str, Any] = {}
+    response_keys = []
+
+    for index, (operation, query_variables) in enumerate(queries):
+        prefix = f"b{index}_"
+        renamed = visit(operation, _VariablePrefixer(prefix))
+        variable_definitions.extend(renamed.variable_definitions or ())
+
+        keys: dict[str, str] = {}
+        for field in renamed.selection_set.selections:
+            key = field.alias.value if field.alias else field.name.value
+            alias = f"{prefix}{key}"
+            keys[key] = alias
+            selections.append(
+                FieldNode(
+                    alias=NameNode(value=alias),
+                    name=field.name,
+                    arguments=field.arguments,
+                    directives=field.directives,
+                    selection_set=field.selection_set,
+                )
+            )
+        response_keys.append(tuple(keys.items()))
+
+        for name, value in (query_variables or {}).items():
+            variables[f"{prefix}{name}"] = value
+
+    operation = OperationDefinitionNode(
+        operation=OperationType.QUERY,
+        name=NameNode(value=BATCH_OPERATION_NAME),
+        variable_definitions=tuple(variable_definitions),
+        directives=(),
+        selection_set=SelectionSetNode(selections=tuple(selections)),
+    )
+    return MergedQuery(
+        document=DocumentNode(definitions=(operation,)),
+        variables=variables,
+        response_keys=tuple(response_keys),
+    )
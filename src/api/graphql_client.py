@@ -4,16 +4,327 @@ This module provides a GraphQL client for GitLab's GraphQL API,
 specifically designed for Work Items API migration.
 """
 
-import os
-from typing import Any
+from __future__ import annotations
 
-from gql import Client, gql
+import asyncio
+import importlib.util
+import os
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from gql import Client, GraphQLRequest, gql
+from gql.transport.exceptions import (
+    TransportAlreadyConnected,
+    TransportConnectionFailed,
+    TransportQueryError,
+    TransportServerError,
+)
 from gql.transport.httpx import HTTPXAsyncTransport
+from graphql import GraphQLError
 
 from .custom_exceptions import GitLabAPIError, GitLabAuthError, GitLabErrorType
+from .graphql_batch import get_batchable_operation, merge_queries
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from gql.client import AsyncClientSession
+    from graphql import DocumentNode, ExecutionResult, OperationDefinitionNode
 
 # Constants
 MAX_QUERY_LOG_LENGTH = 200
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CACHED_QUERY_LENGTH = 64 * 1024
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "on"})
+REQUEST_TIMEOUT = 30.0
+# HTTP/2 multiplexes concurrent operations over one connection when h2 is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingQuery:
+    """A query waiting to be sent as part of the next batch."""
+
+    query_string: str
+    variables: dict[str, Any] | None
+    future: asyncio.Future[dict[str, Any]]
+
+
+@dataclass(slots=True)
+class _LoopConnection:
+    """Transport, gql client and session owned by a single event loop.
+
+    gql sessions and HTTPX connections cannot cross event loops, so each loop
+    that uses a client gets its own connection.
+    """
+
+    transport: _SharedPoolTransport
+    client: Client
+    session: AsyncClientSession | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+def _truncate(text: str, limit: int = MAX_QUERY_LOG_LENGTH) -> str:
+    """Truncate text for inclusion in error details.
+
+    Args:
+        text: The text to truncate
+        limit: Maximum number of characters to keep
+
+    Returns:
+        str: The text, shortened with a trailing ellipsis if it exceeds the limit
+    """
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@lru_cache(maxsize=256)
+def _parse_query(query_string: str) -> DocumentNode:
+    """Parse a GraphQL query string, memoizing the resulting AST.
+
+    Services send a small fixed set of query and mutation strings, so each one
+    is parsed once. DocumentNode is not mutated by execution and is safe to
+    share between coroutines.
+
+    Args:
+        query_string: GraphQL query or mutation string
+
+    Returns:
+        DocumentNode: The parsed document
+    """
+    return gql(query_string).document
+
+
+def _get_batchable_operation(query_string: str) -> OperationDefinitionNode | None:
+    """Get the operation of a query string if it can be merged into a batch.
+
+    Args:
+        query_string: GraphQL query string
+
+    Returns:
+        OperationDefinitionNode | None: The query operation, or None if the query
+        is too large, fails to parse, or cannot be merged
+    """
+    if len(query_string) > MAX_CACHED_QUERY_LENGTH:
+        return None
+    try:
+        return get_batchable_operation(_parse_query(query_string))
+    except GraphQLError:
+        return None
+
+
+def _is_query_error(exc: Exception) -> bool:
+    """GitLab answered with GraphQL errors, or the query failed to parse."""
+    return isinstance(exc, (TransportQueryError, GraphQLError))
+
+
+def _is_timeout(exc: Exception) -> bool:
+    """The request timed out; transport failures wrap the httpx error as __cause__."""
+    return isinstance(exc, TimeoutError) or (
+        isinstance(exc, TransportConnectionFailed)
+        and isinstance(exc.__cause__, httpx.TimeoutException)
+    )
+
+
+def _is_unauthorized(exc: Exception) -> bool:
+    """The GraphQL endpoint rejected the token."""
+    return isinstance(exc, TransportServerError) and exc.code == HTTPStatus.UNAUTHORIZED
+
+
+def _query_failed(
+    exc: Exception, query_string: str, variables: dict[str, Any] | None
+) -> GitLabAPIError:
+    """Build the error for a query GitLab rejected, keeping a preview of it."""
+    return GitLabAPIError(
+        GitLabErrorType.REQUEST_FAILED,
+        {
+            "message": f"GraphQL execution failed: {exc}",
+            "query": _truncate(query_string),
+            "variables": variables,
+        },
+    )
+
+
+def _timed_out(exc: Exception, *_: Any) -> GitLabAPIError:
+    """Build the error for a timed-out request."""
+    return GitLabAPIError(
+        GitLabErrorType.REQUEST_FAILED,
+        {"message": "GraphQL request timed out", "operation": "graphql_execute"},
+    )
+
+
+def _unauthorized(exc: Exception, *_: Any) -> GitLabAPIError:
+    """Build the error for a rejected token."""
+    return GitLabAPIError(
+        GitLabErrorType.INVALID_TOKEN,
+        {"message": "GraphQL authentication failed", "operation": "graphql_execute"},
+        code=exc.code,
+    )
+
+
+def _unexpected(exc: Exception, *_: Any) -> GitLabAPIError:
+    """Build the error for any other failure, keeping the HTTP status if known."""
+    return GitLabAPIError(
+        GitLabErrorType.SERVER_ERROR,
+        {
+            "message": f"Unexpected error during GraphQL execution: {exc}",
+            "operation": "graphql_execute",
+        },
+        code=exc.code if isinstance(exc, TransportServerError) else None,
+    )
+
+
+type _ErrorBuilder = Callable[[Exception, str, dict[str, Any] | None], GitLabAPIError]
+
+# Checked in order; the first matching predicate decides the error type
+_ERROR_RULES: tuple[tuple[Callable[[Exception], bool], _ErrorBuilder], ...] = (
+    (_is_query_error, _query_failed),
+    (_is_timeout, _timed_out),
+    (_is_unauthorized, _unauthorized),
+)
+
+
+def _classify_error(
+    exc: Exception, query_string: str, variables: dict[str, Any] | None
+) -> GitLabAPIError:
+    """Map a failure during GraphQL execution to a GitLabAPIError.
+
+    Args:
+        exc: The exception raised while executing the request
+        query_string: The GraphQL query that was executed
+        variables: The variables it was executed with
+
+    Returns:
+        GitLabAPIError: The error to raise in place of ``exc``
+    """
+    for matches, build in _ERROR_RULES:
+        if matches(exc):
+            return build(exc, query_string, variables)
+    return _unexpected(exc, query_string, variables)
+
+
+def _build_request(query_string: str, variables: dict[str, Any] | None) -> GraphQLRequest:
+    """Build a request from a query string, reusing cached ASTs.
+
+    Args:
+        query_string: GraphQL query or mutation string
+        variables: Query/mutation variables dictionary
+
+    Returns:
+        GraphQLRequest: The request ready for execution
+    """
+    if len(query_string) > MAX_CACHED_QUERY_LENGTH:
+        document = gql(query_string).document
+    else:
+        document = _parse_query(query_string)
+    return GraphQLRequest(document, variable_values=variables or {})
+
+
+def _create_pool() -> httpx.AsyncClient:
+    """Create the HTTPX client that holds the shared GraphQL connection pool.
+
+    Returns:
+        httpx.AsyncClient: A client with the process-wide pool limits
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=REQUEST_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+class _SharedPool:
+    """Process-wide HTTPX clients shared by all GraphQL transports.
+
+    Connections belong to the event loop that opened them, so each loop gets
+    its own client. The server's init thread and the stdio loop both use the
+    pool, so the mapping is guarded by a thread lock.
+    """
+
+    __slots__ = ("clients", "lock")
+
+    def __init__(self) -> None:
+        self.clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self.lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the pool for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            client = self.clients.get(loop)
+            if client is None or client.is_closed:
+                client = self.clients[loop] = _create_pool()
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running loop's pool; pools of other loops are left open."""
+        with self.lock:
+            client = self.clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_shared_pool = _SharedPool()
+
+
+class _SharedPoolTransport(HTTPXAsyncTransport):
+    """HTTPX transport that sends through the shared pool with its own headers."""
+
+    def __init__(self, url: str, headers: dict[str, str]) -> None:
+        super().__init__(url=url)
+        self.headers = headers
+
+    async def connect(self) -> None:
+        if self.client:
+            raise TransportAlreadyConnected("Transport is already connected")
+        self.client = _shared_pool.get()
+
+    async def execute(
+        self,
+        request: GraphQLRequest,
+        *,
+        extra_args: dict[str, Any] | None = None,
+        upload_files: bool = False,
+    ) -> ExecutionResult:
+        # Headers travel per request because the pool is shared between tokens
+        extra_args = {"headers": self.headers, **(extra_args or {})}
+        return await super().execute(
+            request, extra_args=extra_args, upload_files=upload_files
+        )
+
+    async def close(self) -> None:
+        # The pool outlives individual transports; see close_shared_pool()
+        self.client = None
+
+
+async def close_shared_pool() -> None:
+    """Close the running event loop's connection pool shared by all GraphQL clients."""
+    await _shared_pool.aclose()
+
+
+@cache
+def _env_defaults() -> tuple[str, str | None, bool]:
+    """Read the client defaults from the environment once per process.
+
+    Returns:
+        tuple[str, str | None, bool]: Base URL without trailing slash, token and
+        whether query batching is enabled
+    """
+    return (
+        os.getenv("GITLAB_API_URL", "https://gitlab.com").rstrip("/"),
+        os.getenv("GITLAB_PERSONAL_ACCESS_TOKEN"),
+        os.getenv("GITLAB_GRAPHQL_BATCHING", "").lower() in TRUTHY_VALUES,
+    )
 
 
 class GitLabGraphQLClient:
@@ -23,48 +334,99 @@ class GitLabGraphQLClient:
     particularly for Work Items functionality.
     """
 
-    def __init__(self, base_url: str | None = None, token: str | None = None):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        token: str | None = None,
+        batching: bool | None = None,
+    ):
         """Initialize the GraphQL client.
 
         Args:
             base_url: GitLab instance base URL (e.g., 'https://gitlab.com').
                      If None, uses GITLAB_API_URL environment variable.
             token: GitLab personal access token. If None, uses GITLAB_PERSONAL_ACCESS_TOKEN.
+            batching: Whether query() merges concurrent queries into one request.
+                     If None, uses the GITLAB_GRAPHQL_BATCHING environment variable.
         """
-        self.base_url = (base_url or os.getenv("GITLAB_API_URL", "https://gitlab.com")).rstrip('/')
-        self.token = token or os.getenv("GITLAB_PERSONAL_ACCESS_TOKEN")
+        default_url, default_token, default_batching = _env_defaults()
+        self.base_url = base_url.rstrip("/") if base_url else default_url
+        self.token = token or default_token
+        self.batching = default_batching if batching is None else batching
 
         # Don't validate token during init - validate when actually used
+        self._auth_header = {"Authorization": f"Bearer {self.token}"} if self.token else {}
 
         self.graphql_url = f"{self.base_url}/api/graphql"
 
-        # Initialize client as None - will be created when first used
-        self.transport = None
-        self.client = None
+        # Persistent sessions, one per event loop, reused across execute() calls.
+        # The server initialises on a background thread's loop while tools run
+        # on the stdio loop, so the mapping is guarded by a thread lock.
+        self._connections: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopConnection
+        ] = weakref.WeakKeyDictionary()
+        self._connections_lock = threading.Lock()
+        self._close_tasks: set[asyncio.Task[None]] = set()
+
+        # Queries waiting to be merged into the next batch, and in-flight flushes,
+        # per event loop: futures must be resolved on the loop that created them
+        self._pending: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, list[_PendingQuery]
+        ] = weakref.WeakKeyDictionary()
+        self._flush_tasks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, set[asyncio.Task[None]]
+        ] = weakref.WeakKeyDictionary()
+
+    def _new_connection(self) -> _LoopConnection:
+        """Build an unconnected transport and gql client with authentication.
 
-    def _ensure_client(self):
-        """Ensure the GraphQL client is initialized with proper authentication."""
-        if self.client is None:
-            if not self.token:
-                raise GitLabAuthError()
-
-            # Configure transport with authentication
-            headers = {
-                "Authorization": f"Bearer {self.token}",
-            }
-
-            self.transport = HTTPXAsyncTransport(
-                url=self.graphql_url,
-                headers=headers,
-                timeout=30.0
-            )
+        Returns:
+            _LoopConnection: The connection, not yet bound to a session
 
-            # Create gql client with schema fetching disabled for performance
-            self.client = Client(
-                transport=self.transport,
-                fetch_schema_from_transport=False,  # Disable for performance
-                execute_timeout=30.0
-            )
+        Raises:
+            GitLabAuthError: If no access token is configured
+        """
+        if not self.token:
+            raise GitLabAuthError()
+
+        # Configure transport with authentication
+        transport = _SharedPoolTransport(self.graphql_url, self._auth_header)
+
+        # Create gql client with schema fetching disabled for performance
+        client = Client(
+            transport=transport,
+            fetch_schema_from_transport=False,  # Disable for performance
+            execute_timeout=REQUEST_TIMEOUT
+        )
+        return _LoopConnection(transport, client)
+
+    def _connection(self) -> _LoopConnection | None:
+        """Get the connection belonging to the running event loop, if any."""
+        with self._connections_lock:
+            return self._connections.get(asyncio.get_running_loop())
+
+    async def _ensure_session(self) -> AsyncClientSession:
+        """Ensure a connected session exists for the running event loop.
+
+        The session keeps the underlying HTTPX connection pool open, so TCP and
+        TLS connections are reused across queries instead of being rebuilt for
+        every call. Sessions of other event loops are left untouched.
+
+        Returns:
+            AsyncClientSession: The connected session.
+        """
+        loop = asyncio.get_running_loop()
+        with self._connections_lock:
+            connection = self._connections.get(loop)
+            if connection is None:
+                connection = self._connections[loop] = self._new_connection()
+
+        if connection.session is None:
+            async with connection.lock:
+                if connection.session is None:
+                    connection.session = await connection.client.connect_async()
+
+        return connection.session
 
     async def execute(self, query_string: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GraphQL query or mutation.
@@ -78,56 +440,24 @@ class GitLabGraphQLClient:
 
         Raises:
             GitLabAPIError: If the query fails or returns errors
+            GitLabAuthError: If no access token is configured
         """
+        if not self.token:
+            raise GitLabAuthError()
+
         try:
-            # Ensure client is initialized
-            self._ensure_client()
+            # Ensure a persistent session is connected
+            session = await self._ensure_session()
 
-            # Parse the query string
-            query = gql(query_string)
+            # Parse the query string (cached) and bind the variables
+            request = _build_request(query_string, variables)
 
-            # Execute the query using the client
-            async with self.client as session:
-                result = await session.execute(query, variable_values=variables or {})
-                return result
+            return await session.execute(request)
 
+        except GitLabAPIError:
+            raise
         except Exception as exc:
-            # Handle GraphQL errors and convert to GitLabAPIError
-            error_message = str(exc)
-
-            if "GraphQLError" in error_message or "errors" in error_message.lower():
-                raise GitLabAPIError(
-                    GitLabErrorType.REQUEST_FAILED,
-                    {
-                        "message": f"GraphQL execution failed: {error_message}",
-                        "query": query_string[:MAX_QUERY_LOG_LENGTH] + "..." if len(query_string) > MAX_QUERY_LOG_LENGTH else query_string,
-                        "variables": variables,
-                    }
-                ) from exc
-            elif "timeout" in error_message.lower():
-                raise GitLabAPIError(
-                    GitLabErrorType.REQUEST_FAILED,
-                    {
-                        "message": "GraphQL request timed out",
-                        "operation": "graphql_execute",
-                    }
-                ) from exc
-            elif "unauthorized" in error_message.lower() or "401" in error_message:
-                raise GitLabAPIError(
-                    GitLabErrorType.PERMISSION_DENIED,
-                    {
-                        "message": "GraphQL authentication failed",
-                        "operation": "graphql_execute",
-                    }
-                ) from exc
-            else:
-                raise GitLabAPIError(
-                    GitLabErrorType.SERVER_ERROR,
-                    {
-                        "message": f"Unexpected error during GraphQL execution: {error_message}",
-                        "operation": "graphql_execute",
-                    }
-                ) from exc
+            raise _classify_error(exc, query_string, variables) from exc
 
     async def query(self, query_string: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GraphQL query.
@@ -141,8 +471,96 @@ class GitLabGraphQLClient:
         Returns:
             dict: GraphQL response data
         """
+        if self.batching:
+            return await self.execute_batched(query_string, variables)
         return await self.execute(query_string, variables)
 
+    async def execute_batched(
+        self, query_string: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query, merged with other queries issued in the same tick.
+
+        Queries scheduled before the event loop next runs its callbacks are sent
+        as one aliased operation; queries from other event loops are batched
+        separately on their own loops. If the merged request fails, each query is
+        retried on its own so callers get their usual result or error.
+
+        Args:
+            query_string: GraphQL query string
+            variables: Query variables dictionary
+
+        Returns:
+            dict: GraphQL response data
+
+        Raises:
+            GitLabAPIError: If the query fails or returns errors
+        """
+        if not self.batching:
+            return await self.execute(query_string, variables)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        with self._connections_lock:
+            pending = self._pending.setdefault(loop, [])
+            pending.append(_PendingQuery(query_string, variables, future))
+            first = len(pending) == 1
+        if first:
+            loop.call_soon(self._start_flush, loop)
+        return await future
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Take the loop's pending queries and execute them in the background."""
+        with self._connections_lock:
+            batch = self._pending.pop(loop, [])
+            tasks = self._flush_tasks.setdefault(loop, set())
+        task = loop.create_task(self._flush(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _flush(self, batch: list[_PendingQuery]) -> None:
+        """Execute a batch of pending queries, merging those that allow it."""
+        mergeable: list[tuple[_PendingQuery, OperationDefinitionNode]] = []
+        individual: list[_PendingQuery] = []
+        for pending in batch:
+            operation = _get_batchable_operation(pending.query_string)
+            if operation is None:
+                individual.append(pending)
+            else:
+                mergeable.append((pending, operation))
+
+        if len(mergeable) == 1:
+            individual.append(mergeable.pop()[0])
+
+        if mergeable:
+            merged = merge_queries(
+                [(operation, pending.variables) for pending, operation in mergeable]
+            )
+            try:
+                session = await self._ensure_session()
+                data = await session.execute(
+                    GraphQLRequest(merged.document, variable_values=merged.variables)
+                )
+            except Exception:
+                # Re-run separately so every caller sees its own error
+                individual.extend(pending for pending, _ in mergeable)
+            else:
+                for (pending, _), result in zip(mergeable, merged.split(data), strict=True):
+                    if not pending.future.done():
+                        pending.future.set_result(result)
+
+        await asyncio.gather(*(self._execute_pending(pending) for pending in individual))
+
+    async def _execute_pending(self, pending: _PendingQuery) -> None:
+        """Execute a single pending query and resolve its future."""
+        try:
+            result = await self.execute(pending.query_string, pending.variables)
+        except Exception as exc:
+            if not pending.future.done():
+                pending.future.set_exception(exc)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(result)
+
     async def mutation(self, mutation_string: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """Execute a GraphQL mutation.
 
@@ -158,22 +576,59 @@ class GitLabGraphQLClient:
         return await self.execute(mutation_string, variables)
 
     async def close(self):
-        """Close the transport connection."""
-        await self.transport.close()
+        """Close the running event loop's session and its transport connection.
 
-    @classmethod
-    async def close_singleton(cls):
-        """Close the singleton client connection if it exists."""
-        if hasattr(cls, '_instance') and cls._instance is not None:
-            await cls._instance.close()
-            cls._instance = None
+        Safe to call repeatedly and on clients that never connected. Sessions
+        opened by other event loops are left to those loops. The connection is
+        dropped even if closing the session fails, so the next call reconnects
+        from scratch.
+        """
+        with self._connections_lock:
+            connection = self._connections.pop(asyncio.get_running_loop(), None)
+        if connection is not None and connection.session is not None:
+            await connection.client.close_async()
+
+    def schedule_close(self) -> None:
+        """Close the sessions of every event loop on their own loops, without waiting.
+
+        For callers that cannot await, such as initialize_graphql_client().
+        Connections whose loop has already closed are dropped.
+        """
+        with self._connections_lock:
+            loops = list(self._connections.keys())
+
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._start_close, loop)
+            except RuntimeError:
+                # The loop is closed, so its session can no longer be used
+                with self._connections_lock:
+                    self._connections.pop(loop, None)
+
+    def _start_close(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Run close() as a task on the given loop, keeping a reference to it."""
+        task = loop.create_task(self.close())
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+
+# Arguments for the default client, set by initialize_graphql_client()
+_default_client_args: dict[str, str | None] = {}
+
+
+@cache
+def _default_client() -> GitLabGraphQLClient:
+    """Create the process-wide GraphQL client on first use.
+
+    Returns:
+        GitLabGraphQLClient: The cached client instance
+    """
+    return GitLabGraphQLClient(**_default_client_args)
 
 
 class GitLabGraphQLClientSingleton:
     """Singleton wrapper for GitLabGraphQLClient to avoid global state."""
 
-    _instance: GitLabGraphQLClient | None = None
-
     @classmethod
     def initialize(cls, base_url: str | None = None, token: str | None = None) -> GitLabGraphQLClient:
         """Initialize the singleton GraphQL client instance.
@@ -185,8 +640,7 @@ class GitLabGraphQLClientSingleton:
         Returns:
             GitLabGraphQLClient: The initialized client
         """
-        cls._instance = GitLabGraphQLClient(base_url, token)
-        return cls._instance
+        return initialize_graphql_client(base_url, token)
 
     @classmethod
     def get_instance(cls) -> GitLabGraphQLClient:
@@ -200,14 +654,23 @@ class GitLabGraphQLClientSingleton:
         Raises:
             GitLabAuthError: If authentication token is not available
         """
-        if cls._instance is None:
-            cls._instance = GitLabGraphQLClient()
-        return cls._instance
+        return _default_client()
+
+    @classmethod
+    async def close_singleton(cls) -> None:
+        """Close the singleton client and the shared connection pool."""
+        if _default_client.cache_info().currsize:
+            await _default_client().close()
+            _default_client.cache_clear()
+        await close_shared_pool()
 
 
 def initialize_graphql_client(base_url: str | None = None, token: str | None = None) -> GitLabGraphQLClient:
     """Initialize the GraphQL client instance.
 
+    Environment defaults are re-read, so variables set before this call apply.
+    Sessions held by the client being replaced are closed in the background.
+
     Args:
         base_url: GitLab instance base URL (optional, uses env var if not provided)
         token: GitLab authentication token (optional, uses env var if not provided)
@@ -215,7 +678,12 @@ def initialize_graphql_client(base_url: str | None = None, token: str | None = N
     Returns:
         GitLabGraphQLClient: The initialized client
     """
-    return GitLabGraphQLClientSingleton.initialize(base_url, token)
+    if _default_client.cache_info().currsize:
+        _default_client().schedule_close()
+    _default_client_args.update(base_url=base_url, token=token)
+    _env_defaults.cache_clear()
+    _default_client.cache_clear()
+    return _default_client()
 
 
 def get_graphql_client() -> GitLabGraphQLClient:
@@ -229,8 +697,4 @@ def get_graphql_client() -> GitLabGraphQLClient:
     Raises:
         GitLabAuthError: If authentication token is not available
     """
-    return GitLabGraphQLClientSingleton.get_instance()
-
-
-# Singleton instance for global use (like REST client) - lazy initialization
-gitlab_graphql_client = None
+    return _default_client()
@@ -0,0 +1,119 @@
+"""ETag-aware HTTP transport for conditional GitLab GET requests."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_CACHE_CAPACITY = 512
+MAX_CACHED_BODY_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    """A stored GET response that can be revalidated with its ETag."""
+
+    etag: str
+    headers: httpx.Headers
+    body: bytes
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Build a fresh 200 response from the stored body.
+
+        Args:
+            request: The request being answered from the cache.
+
+        Returns:
+            A response equivalent to the originally cached one.
+        """
+        return httpx.Response(
+            200,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.body),
+            request=request,
+        )
+
+
+class ETagCacheTransport(httpx.AsyncBaseTransport):
+    """Transport that revalidates GET requests with If-None-Match.
+
+    Responses carrying an ETag are stored in a bounded LRU keyed on the full
+    request URL, which includes query and pagination parameters. Subsequent
+    GETs for the same URL send the stored ETag and, when GitLab answers
+    ``304 Not Modified``, are served the cached body instead of a full payload.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        capacity: int = DEFAULT_CACHE_CAPACITY,
+    ) -> None:
+        """Initialize the caching transport.
+
+        Args:
+            transport: The transport that performs the actual network I/O.
+            capacity: Maximum number of responses kept in the cache.
+        """
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._capacity = capacity
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, revalidating cached GET responses.
+
+        Args:
+            request: The outgoing request.
+
+        Returns:
+            The response from GitLab, or the cached response on a 304.
+        """
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        key = str(request.url)
+        cached = self._entries.get(key)
+        if cached is not None and "If-None-Match" not in request.headers:
+            request.headers["If-None-Match"] = cached.etag
+
+        response = await self._transport.handle_async_request(request)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            self._entries.move_to_end(key)
+            return cached.to_response(request)
+
+        etag = response.headers.get("ETag")
+        if response.status_code != httpx.codes.OK or not etag:
+            return response
+
+        # Keep the body exactly as received so content decoding still happens
+        # once, in the client, for both fresh and cached responses.
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        entry = _CachedResponse(etag=etag, headers=response.headers, body=body)
+        if len(body) <= MAX_CACHED_BODY_SIZE:
+            self._store(key, entry)
+        return entry.to_response(request)
+
+    def _store(self, key: str, entry: _CachedResponse) -> None:
+        """Insert an entry, evicting the least recently used one when full.
+
+        Args:
+            key: The cache key (full request URL).
+            entry: The response to cache.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    async def aclose(self) -> None:
+        """Close the underlying transport and drop cached responses."""
+        self.clear()
+        await self._transport.aclose()
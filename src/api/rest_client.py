@@ -1,12 +1,31 @@
 """REST client for making HTTP requests to the GitLab API."""
 
+from __future__ import annotations
+
+import asyncio
 import os
-from collections.abc import AsyncIterator
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+try:
+    # orjson decodes large list payloads several times faster than stdlib json
+    # and encodes request bodies straight to compact UTF-8 bytes
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as _stdlib_dumps, loads as json_loads
+
+    def json_dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON, matching orjson.dumps."""
+        return _stdlib_dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
 from src.api.custom_exceptions import GitLabAPIError, GitLabAuthError, GitLabErrorType
+from src.api.http_cache import ETagCacheTransport
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pydantic import BaseModel, TypeAdapter
 
 
 class GitLabRestClient:
@@ -17,6 +36,7 @@ class GitLabRestClient:
         self._base_url = os.getenv("GITLAB_API_URL", "https://gitlab.com")
         self._token = os.getenv("GITLAB_PERSONAL_ACCESS_TOKEN")
         self._httpx_client: httpx.AsyncClient | None = None
+        self._inflight: dict[str, asyncio.Task[httpx.Response]] = {}
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for authenticating with the GitLab API.
@@ -31,6 +51,14 @@ class GitLabRestClient:
             raise GitLabAuthError()
         return {"PRIVATE-TOKEN": self._token}
 
+    def _get_json_headers(self) -> dict[str, str]:
+        """Get authentication headers for a request with a JSON body.
+
+        Returns:
+            The headers including authentication token and JSON content type.
+        """
+        return {**self._get_headers(), "Content-Type": "application/json"}
+
     def get_api_url(self) -> str:
         """Get the base URL for the GitLab API.
 
@@ -42,11 +70,17 @@ class GitLabRestClient:
     def get_httpx_client(self) -> httpx.AsyncClient:
         """Get or create an async HTTP client.
 
+        GET requests go through an ETag-aware transport, so repeated reads of
+        unchanged resources are revalidated instead of re-downloaded.
+
         Returns:
             The async HTTP client.
         """
         if self._httpx_client is None:
-            self._httpx_client = httpx.AsyncClient(base_url=f"{self._base_url}/api/v4")
+            self._httpx_client = httpx.AsyncClient(
+                base_url=f"{self._base_url}/api/v4",
+                transport=ETagCacheTransport(),
+            )
         return self._httpx_client
 
     async def aclose(self) -> None:
@@ -66,6 +100,50 @@ class GitLabRestClient:
         """
         raise GitLabAPIError.from_response(response)
 
+    async def _coalesced_get(
+        self, path: str, headers: dict[str, str], params: dict[str, Any] | None
+    ) -> httpx.Response:
+        """Send a GET request, sharing it with identical concurrent callers.
+
+        While a GET for the same path and query parameters is in flight, later
+        callers await that request instead of issuing their own round trip.
+
+        Args:
+            path: The API endpoint path.
+            headers: The request headers.
+            params: Optional query parameters.
+
+        Returns:
+            The HTTP response.
+        """
+        key = path
+        if params:
+            key = f"{path}?{httpx.QueryParams(sorted(params.items()))}"
+
+        task = self._inflight.get(key)
+        if task is None:
+            client = self.get_httpx_client()
+            task = asyncio.ensure_future(
+                client.get(path, headers=headers, params=params)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # Shield so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Task[httpx.Response]) -> None:
+        """Remove a finished request from the in-flight map.
+
+        Args:
+            key: The request key.
+            task: The finished request task.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled
+            task.exception()
+
     def _encode_path_parameter(self, param: str) -> str:
         """URL encode a path parameter for use in GitLab API URLs.
 
@@ -90,13 +168,78 @@ class GitLabRestClient:
         Raises:
             GitLabAPIError: If the request fails.
         """
-        client = self.get_httpx_client()
         headers = self._get_headers()
 
         try:
-            response = await client.get(path, headers=headers, params=params)
+            response = await self._coalesced_get(path, headers, params)
+            if response.is_success:
+                return json_loads(response.content)
+            self._handle_error_response(response)
+        except httpx.HTTPError as exc:
+            raise GitLabAPIError(
+                GitLabErrorType.REQUEST_FAILED,
+                {"message": str(exc), "action": "get"},
+            ) from exc
+
+    async def get_model_async[M: BaseModel](
+        self, path: str, model: type[M], params: dict[str, Any] | None = None
+    ) -> M:
+        """Make an async GET request and validate the JSON body into a model.
+
+        The response bytes go straight to pydantic-core's JSON parser, so no
+        intermediate Python dict is built.
+
+        Args:
+            path: The API endpoint path.
+            model: The model to validate the response into.
+            params: Optional query parameters.
+
+        Returns:
+            The validated model instance.
+
+        Raises:
+            GitLabAPIError: If the request fails.
+            pydantic.ValidationError: If the response does not match the model.
+        """
+        headers = self._get_headers()
+
+        try:
+            response = await self._coalesced_get(path, headers, params)
+            if response.is_success:
+                return model.model_validate_json(response.content)
+            self._handle_error_response(response)
+        except httpx.HTTPError as exc:
+            raise GitLabAPIError(
+                GitLabErrorType.REQUEST_FAILED,
+                {"message": str(exc), "action": "get"},
+            ) from exc
+
+    async def get_validated_async[T](
+        self, path: str, adapter: TypeAdapter[T], params: dict[str, Any] | None = None
+    ) -> T:
+        """Make an async GET request and validate the JSON body with a TypeAdapter.
+
+        Use this for list endpoints: a ``list[Model]`` adapter validates the
+        whole array from the response bytes in a single native pass.
+
+        Args:
+            path: The API endpoint path.
+            adapter: The adapter describing the expected response type.
+            params: Optional query parameters.
+
+        Returns:
+            The validated response.
+
+        Raises:
+            GitLabAPIError: If the request fails.
+            pydantic.ValidationError: If the response does not match the type.
+        """
+        headers = self._get_headers()
+
+        try:
+            response = await self._coalesced_get(path, headers, params)
             if response.is_success:
-                return response.json()
+                return adapter.validate_json(response.content)
             self._handle_error_response(response)
         except httpx.HTTPError as exc:
             raise GitLabAPIError(
@@ -117,11 +260,10 @@ class GitLabRestClient:
         Raises:
             GitLabAPIError: If the request fails.
         """
-        client = self.get_httpx_client()
         headers = self._get_headers()
 
         try:
-            response = await client.get(path, headers=headers, params=params)
+            response = await self._coalesced_get(path, headers, params)
             if response.is_success:
                 return response.text
             self._handle_error_response(response)
@@ -131,37 +273,86 @@ class GitLabRestClient:
                 {"message": str(exc), "action": "get_raw"},
             ) from exc
 
-    async def post_async(
-        self, path: str, json_data: dict[str, Any], params: dict[str, Any] | None = None
-    ) -> Any:
-        """Make an async POST request to the GitLab API.
+    async def _send_json(
+        self,
+        method: str,
+        path: str,
+        json_data: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Send a request with a JSON body and return the successful response.
 
         Args:
+            method: The HTTP method, e.g. "POST" or "PUT".
             path: The API endpoint path.
             json_data: The JSON data to send.
             params: Optional query parameters.
 
         Returns:
-            The JSON response.
+            The successful HTTP response.
 
         Raises:
             GitLabAPIError: If the request fails.
         """
         client = self.get_httpx_client()
-        headers = self._get_headers()
+        headers = self._get_json_headers()
 
         try:
-            response = await client.post(
-                path, headers=headers, json=json_data, params=params
+            response = await client.request(
+                method, path, headers=headers, content=json_dumps(json_data), params=params
             )
-            if response.is_success:
-                return response.json()
-            self._handle_error_response(response)
         except httpx.HTTPError as exc:
             raise GitLabAPIError(
                 GitLabErrorType.REQUEST_FAILED,
-                {"message": str(exc), "action": "post"},
+                {"message": str(exc), "action": method.lower()},
             ) from exc
+        if not response.is_success:
+            self._handle_error_response(response)
+        return response
+
+    async def post_async(
+        self, path: str, json_data: dict[str, Any], params: dict[str, Any] | None = None
+    ) -> Any:
+        """Make an async POST request to the GitLab API.
+
+        Args:
+            path: The API endpoint path.
+            json_data: The JSON data to send.
+            params: Optional query parameters.
+
+        Returns:
+            The JSON response.
+
+        Raises:
+            GitLabAPIError: If the request fails.
+        """
+        response = await self._send_json("POST", path, json_data, params)
+        return json_loads(response.content)
+
+    async def post_model_async[M: BaseModel](
+        self,
+        path: str,
+        model: type[M],
+        json_data: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> M:
+        """Make an async POST request and validate the JSON body into a model.
+
+        Args:
+            path: The API endpoint path.
+            model: The model to validate the response into.
+            json_data: The JSON data to send.
+            params: Optional query parameters.
+
+        Returns:
+            The validated model instance.
+
+        Raises:
+            GitLabAPIError: If the request fails.
+            pydantic.ValidationError: If the response does not match the model.
+        """
+        response = await self._send_json("POST", path, json_data, params)
+        return model.model_validate_json(response.content)
 
     async def put_async(
         self, path: str, json_data: dict[str, Any], params: dict[str, Any] | None = None
@@ -179,21 +370,33 @@ class GitLabRestClient:
         Raises:
             GitLabAPIError: If the request fails.
         """
-        client = self.get_httpx_client()
-        headers = self._get_headers()
+        response = await self._send_json("PUT", path, json_data, params)
+        return json_loads(response.content)
+
+    async def put_model_async[M: BaseModel](
+        self,
+        path: str,
+        model: type[M],
+        json_data: dict[str, Any],
+        params: dict[str, Any] | None = None,
+    ) -> M:
+        """Make an async PUT request and validate the JSON body into a model.
 
-        try:
-            response = await client.put(
-                path, headers=headers, json=json_data, params=params
-            )
-            if response.is_success:
-                return response.json()
-            self._handle_error_response(response)
-        except httpx.HTTPError as exc:
-            raise GitLabAPIError(
-                GitLabErrorType.REQUEST_FAILED,
-                {"message": str(exc), "action": "put"},
-            ) from exc
+        Args:
+            path: The API endpoint path.
+            model: The model to validate the response into.
+            json_data: The JSON data to send.
+            params: Optional query parameters.
+
+        Returns:
+            The validated model instance.
+
+        Raises:
+            GitLabAPIError: If the request fails.
+            pydantic.ValidationError: If the response does not match the model.
+        """
+        response = await self._send_json("PUT", path, json_data, params)
+        return model.model_validate_json(response.content)
 
     async def delete_async(
         self, path: str, params: dict[str, Any] | None = None
@@ -216,8 +419,8 @@ class GitLabRestClient:
         try:
             response = await client.delete(path, headers=headers, params=params)
             if response.is_success:
-                if response.text:
-                    return response.json()
+                if response.content:
+                    return json_loads(response.content)
                 return None
             self._handle_error_response(response)
         except httpx.HTTPError as exc:
@@ -258,7 +461,7 @@ class GitLabRestClient:
                 if not response.is_success:
                     self._handle_error_response(response)
 
-                data = response.json()
+                data = json_loads(response.content)
                 if not data or not isinstance(data, list):
                     break
 
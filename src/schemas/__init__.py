@@ -0,0 +1,197 @@
+"""Pydantic schemas for GitLab API inputs and responses.
+
+Submodules are imported on first attribute access, so importing one schema
+does not build the pydantic models of every other module.
+"""
+
+import importlib
+from typing import Any
+
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "base": (
+        "GitLabResponseBase",
+        "GitLabInputBase",
+        "GitLabUserRef",
+        "BaseResponseList",
+        "PaginatedResponse",
+        "VisibilityLevel",
+        "VISIBILITY_LEVELS",
+    ),
+    "branches": (
+        "AccessLevel",
+        "CreateBranchInput",
+        "GitLabReference",
+        "GitLabBranchList",
+        "GetDefaultBranchRefInput",
+        "ListBranchesInput",
+        "DeleteBranchInput",
+        "GetBranchInput",
+        "DeleteMergedBranchesInput",
+        "AccessLevelModel",
+        "ProtectBranchInput",
+        "UnprotectBranchInput",
+    ),
+    "commits": (
+        "CommitStats",
+        "GitLabCommitDetail",
+    ),
+    "files": (
+        "GetFileContentsInput",
+        "GetFileRawInput",
+        "GetFileTreeInput",
+        "GitLabContent",
+        "CreateFileInput",
+        "UpdateFileInput",
+        "DeleteFileInput",
+        "FileOperationResponse",
+        "FileEncoding",
+    ),
+    "groups": (
+        "GroupAccessLevel",
+        "GitLabGroup",
+        "ListGroupsInput",
+        "GitLabGroupListResponse",
+        "GetGroupInput",
+        "CreateGroupInput",
+        "UpdateGroupInput",
+        "DeleteGroupInput",
+        "GetGroupByProjectNamespaceInput",
+    ),
+    "iterations": (
+        "UpdateIterationInput",
+        "ListIterationsInput",
+        "GetIterationInput",
+        "DeleteIterationInput",
+        "GitLabIteration",
+        "IterationListResponse",
+    ),
+    "jobs": (
+        "JobLogsInput",
+        "JobLogsResponse",
+    ),
+    "labels": (
+        "GitLabLabel",
+        "ListLabelsInput",
+        "GetLabelInput",
+        "CreateLabelInput",
+        "UpdateLabelInput",
+        "DeleteLabelInput",
+        "SubscribeToLabelInput",
+        "UnsubscribeFromLabelInput",
+        "GitLabLabelListResponse",
+    ),
+    "merge_requests": (
+        "MergeStatus",
+        "MergeRequestState",
+        "DiffRefs",
+        "CreateMergeRequestInput",
+        "GitLabMergeRequest",
+        "ListMergeRequestsInput",
+        "GitLabMergeRequestListResponse",
+        "GetMergeRequestInput",
+        "UpdateMergeRequestInput",
+        "MergeMergeRequestInput",
+        "AcceptedMergeRequest",
+        "MergeRequestThread",
+        "MergeRequestSuggestion",
+        "CreateMergeRequestCommentInput",
+        "CreateMergeRequestThreadInput",
+        "ApplySuggestionInput",
+        "ApplyMultipleSuggestionsInput",
+        "GitLabComment",
+        "MergeRequestChanges",
+    ),
+    "milestones": (
+        "CreateMilestoneInput",
+        "UpdateMilestoneInput",
+        "ListMilestonesInput",
+        "GetMilestoneInput",
+        "DeleteMilestoneInput",
+        "GitLabMilestone",
+        "MilestoneListResponse",
+    ),
+    "repositories": (
+        "CreateRepositoryInput",
+        "GitLabRepository",
+        "TreeItemType",
+        "ListRepositoryTreeInput",
+        "RepositoryTreeItem",
+        "RepositoryTreeResponse",
+        "SearchProjectsInput",
+        "GetRepositoryInput",
+        "ListRepositoriesInput",
+        "UpdateRepositoryInput",
+        "DeleteRepositoryInput",
+        "GitLabSearchResponse",
+    ),
+    "search": (
+        "SearchScope",
+        "BlobSearchFilters",
+        "SearchRequest",
+        "GlobalSearchRequest",
+        "GroupSearchRequest",
+        "ProjectSearchRequest",
+        "SearchResult",
+        "ProjectSearchResult",
+        "BlobSearchResult",
+        "IssueSearchResult",
+        "MergeRequestSearchResult",
+        "CommitSearchResult",
+        "MilestoneSearchResult",
+        "NoteSearchResult",
+        "SearchResponse",
+    ),
+    "work_items": (
+        "WorkItemType",
+        "WorkItemState",
+        "WorkItemTypeRef",
+        "WorkItemRef",
+        "WorkItemLabelRef",
+        "WorkItemWidget",
+        "WorkItemAssigneeWidget",
+        "WorkItemHierarchyWidget",
+        "WorkItemLabelsWidget",
+        "WorkItemMilestoneWidget",
+        "WorkItemIterationWidget",
+        "WorkItemDatesWidget",
+        "WorkItemDescriptionWidget",
+        "WorkItemNotesWidget",
+        "WorkItemProgressWidget",
+        "WorkItemHealthStatusWidget",
+        "WorkItemWeightWidget",
+        "GitLabWorkItem",
+        "CreateWorkItemInput",
+        "AssigneeWidgetOperation",
+        "LabelWidgetOperation",
+        "HierarchyWidgetOperation",
+        "MilestoneWidgetOperation",
+        "IterationWidgetOperation",
+        "DatesWidgetOperation",
+        "UpdateWorkItemInput",
+        "DeleteWorkItemInput",
+        "GetWorkItemInput",
+        "ListWorkItemsInput",
+        "WORK_ITEM_TYPES",
+    ),
+}
+
+_EXPORT_MODULES = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+__all__ = tuple(_EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` and cache the attribute."""
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module globals together with the lazily exported names."""
+    return sorted(set(globals()) | _EXPORT_MODULES.keys())
@@ -0,0 +1,55 @@
+"""Shared annotated field types for schema models.
+
+Fields that repeat across many models are declared once here so their
+``FieldInfo`` (and description) is shared instead of rebuilt per class.
+"""
+
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BeforeValidator, Field, PlainSerializer
+
+GroupId = Annotated[str, Field(description="The numeric ID or path of the group")]
+OptionalGroupId = Annotated[str | None, Field(description="The numeric ID or path of the group")]
+OptionalProjectPath = Annotated[str | None, Field(description="The full namespace path of the project")]
+MilestoneId = Annotated[int, Field(description="The numeric ID of the milestone")]
+IterationId = Annotated[int, Field(description="The numeric ID of the iteration")]
+Page = Annotated[int, Field(description="Page number for pagination")]
+ProjectInfo = Annotated[
+    dict[str, Any] | None,
+    Field(description="Project information including name and namespace"),
+]
+
+
+def _check_group_path_suffix(value: str) -> str:
+    """Reject group paths ending in a suffix GitLab reserves."""
+    if value.endswith((".git", ".atom")):
+        raise ValueError("Group path cannot end in '.git' or '.atom'")
+    return value
+
+
+# GitLab's namespace path rule: letters, digits, '_', '-' and '.', starting with
+# a letter, digit or '_'. pydantic-core matches patterns with Rust's linear-time
+# regex engine, which has no lookaround, so the reserved suffixes are checked
+# separately.
+GroupPath = Annotated[
+    str,
+    Field(pattern=r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$"),
+    AfterValidator(_check_group_path_suffix),
+]
+
+
+def _split_labels(value: Any) -> Any:
+    """Accept label names given as one comma-separated string."""
+    if isinstance(value, str):
+        return tuple(label for label in (part.strip() for part in value.split(",")) if label)
+    return value
+
+
+# Label names are normalised once on validation into an immutable, hashable
+# tuple and dumped in the comma-separated form the REST API expects for query
+# and body parameters.
+LabelNames = Annotated[
+    tuple[str, ...],
+    BeforeValidator(_split_labels),
+    PlainSerializer(",".join, return_type=str),
+]
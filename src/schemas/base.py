@@ -1,13 +1,72 @@
 from __future__ import annotations
 
-from enum import Enum
+from functools import cache
+from typing import Literal, get_args
 
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class GitLabResponseBase(BaseModel):
-    """Base class for GitLab API responses."""
+    """Base class for GitLab API responses.
 
+    Responses are immutable snapshots of API data; use ``model_copy(update=...)``
+    to derive a modified instance. Unknown fields returned by GitLab are ignored.
+    Validators are built on first use rather than at import time, so server
+    startup does not pay for models that a session never touches.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True, defer_build=True)
+
+
+@cache
+def list_adapter[M: BaseModel](model: type[M]) -> TypeAdapter[list[M]]:
+    """Return a cached adapter that validates a JSON list into model instances.
+
+    Validating the whole list in one call avoids a Python-level loop over
+    ``model_validate``. List wrappers such as PaginatedResponse can then be
+    built with ``model_construct`` from the already validated items.
+
+    Args:
+        model: The model type of the list items.
+
+    Returns:
+        TypeAdapter[list[M]]: The adapter for ``list[model]``.
+    """
+    return TypeAdapter(list[model])
+
+
+class GitLabInputBase(BaseModel):
+    """Base class for immutable tool input models.
+
+    Inputs are built once per tool call and only read afterwards, so they are
+    frozen. Like responses, their validators are built on first use.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
+
+
+class GitLabUserRef(GitLabResponseBase):
+    """Reference to a GitLab user embedded in another resource.
+
+    Used for author, assignee and resolver fields. REST responses use numeric
+    IDs and snake_case keys while GraphQL returns global IDs and camelCase, so
+    both spellings are accepted.
+
+    Attributes:
+        id: Numeric user ID (REST) or global ID (GraphQL).
+        username: The user's handle.
+        name: The user's display name.
+        state: Account state (e.g., "active", "blocked").
+        avatar_url: URL of the user's avatar.
+        web_url: URL of the user's profile page.
+    """
+
+    id: int | str
+    username: str
+    name: str | None = None
+    state: str | None = None
+    avatar_url: str | None = Field(None, validation_alias=AliasChoices("avatar_url", "avatarUrl"))
+    web_url: str | None = Field(None, validation_alias=AliasChoices("web_url", "webUrl"))
 
 
 class BaseResponseList[T](GitLabResponseBase):
@@ -37,15 +96,9 @@ class PaginatedResponse[T](GitLabResponseBase):
     items: list[T]
 
 
-class VisibilityLevel(str, Enum):
-    """GitLab repository visibility levels.
-
-    Attributes:
-        PRIVATE: Only project members can access.
-        INTERNAL: Any authenticated user can access.
-        PUBLIC: Anyone can access.
-    """
-
-    PRIVATE = "private"
-    INTERNAL = "internal"
-    PUBLIC = "public"
+# GitLab visibility levels:
+#   private  - only members can access
+#   internal - any authenticated user can access
+#   public   - anyone can access
+VisibilityLevel = Literal["private", "internal", "public"]
+VISIBILITY_LEVELS: tuple[VisibilityLevel, ...] = get_args(VisibilityLevel)
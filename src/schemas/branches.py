@@ -2,9 +2,9 @@
 
 from enum import Enum
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, HttpUrl
 
-from src.schemas.base import BaseResponseList, GitLabResponseBase
+from src.schemas.base import BaseResponseList, GitLabInputBase, GitLabResponseBase
 from src.schemas.commits import GitLabCommitDetail
 
 
@@ -24,7 +24,7 @@ class AccessLevel(int, Enum):
     ADMIN = 60
 
 
-class CreateBranchInput(BaseModel):
+class CreateBranchInput(GitLabInputBase):
     """Input model for creating a new branch in a GitLab repository.
 
     Creates a new branch pointing to a specific commit, branch, or tag.
@@ -81,7 +81,7 @@ class GitLabReference(GitLabResponseBase):
     """
 
     name: str
-    commit: GitLabCommitDetail = Field(...)
+    commit: GitLabCommitDetail
     merged: bool = False
     protected: bool = False
     default: bool = False
@@ -96,7 +96,7 @@ class GitLabBranchList(BaseResponseList[GitLabReference]):
 
 
 
-class GetDefaultBranchRefInput(BaseModel):
+class GetDefaultBranchRefInput(GitLabInputBase):
     """Input model for getting the default branch of a GitLab repository.
 
     Attributes:
@@ -106,7 +106,7 @@ class GetDefaultBranchRefInput(BaseModel):
     project_path: str
 
 
-class ListBranchesInput(BaseModel):
+class ListBranchesInput(GitLabInputBase):
     """Input model for listing branches in a GitLab repository.
 
     Attributes:
@@ -122,7 +122,7 @@ class ListBranchesInput(BaseModel):
     per_page: int = 20
 
 
-class DeleteBranchInput(BaseModel):
+class DeleteBranchInput(GitLabInputBase):
     """Input model for deleting a branch from a GitLab repository.
 
     Attributes:
@@ -134,7 +134,7 @@ class DeleteBranchInput(BaseModel):
     branch_name: str
 
 
-class GetBranchInput(BaseModel):
+class GetBranchInput(GitLabInputBase):
     """Input model for getting a single branch from a GitLab repository.
 
     Attributes:
@@ -146,7 +146,7 @@ class GetBranchInput(BaseModel):
     branch_name: str
 
 
-class DeleteMergedBranchesInput(BaseModel):
+class DeleteMergedBranchesInput(GitLabInputBase):
     """Input model for deleting all merged branches in a GitLab repository.
 
     Attributes:
@@ -166,7 +166,7 @@ class AccessLevelModel(BaseModel):
     access_level: AccessLevel
 
 
-class ProtectBranchInput(BaseModel):
+class ProtectBranchInput(GitLabInputBase):
     """Input model for protecting a branch in a GitLab repository.
 
     Attributes:
@@ -186,7 +186,7 @@ class ProtectBranchInput(BaseModel):
     code_owner_approval_required: bool = False
 
 
-class UnprotectBranchInput(BaseModel):
+class UnprotectBranchInput(GitLabInputBase):
     """Input model for unprotecting a branch in a GitLab repository.
 
     Attributes:
@@ -1,8 +1,24 @@
 """Pydantic schemas for GitLab commit data structures."""
 
+from datetime import datetime
+
 from src.schemas.base import GitLabResponseBase
 
 
+class CommitStats(GitLabResponseBase):
+    """Line change statistics of a GitLab commit.
+
+    Attributes:
+        additions: Number of added lines.
+        deletions: Number of deleted lines.
+        total: Total number of changed lines.
+    """
+
+    additions: int = 0
+    deletions: int = 0
+    total: int = 0
+
+
 class GitLabCommitDetail(GitLabResponseBase):
     """Response model for GitLab commit details.
 
@@ -22,7 +38,9 @@ class GitLabCommitDetail(GitLabResponseBase):
                 Examples: 'Fix login\\n\\nResolves issue with OAuth provider'
         created_at: ISO 8601 timestamp when the commit was created.
                    Examples: '2024-01-15T10:30:00.000Z'
-        stats: Optional commit statistics (additions, deletions, files changed).
+        authored_date: ISO 8601 timestamp when the change was originally authored.
+        committed_date: ISO 8601 timestamp when the commit was applied.
+        stats: Optional commit statistics (additions, deletions, total).
               May be null if statistics weren't requested or calculated.
 
     Note: This model represents commit metadata, not the actual file changes.
@@ -34,3 +52,16 @@ class GitLabCommitDetail(GitLabResponseBase):
     title: str
     message: str
     created_at: str
+    authored_date: str | None = None
+    committed_date: str | None = None
+    stats: CommitStats | None = None
+
+    @property
+    def authored_at(self) -> datetime | None:
+        """Parse authored_date on demand; the raw string is what gets serialized."""
+        return datetime.fromisoformat(self.authored_date) if self.authored_date else None
+
+    @property
+    def committed_at(self) -> datetime | None:
+        """Parse committed_date on demand; the raw string is what gets serialized."""
+        return datetime.fromisoformat(self.committed_date) if self.committed_date else None
@@ -1,9 +1,12 @@
-from pydantic import BaseModel
+from typing import Literal
 
-from src.schemas.base import GitLabResponseBase
+from src.schemas.base import GitLabInputBase, GitLabResponseBase
 
+# Content encodings accepted and returned by the repository files API.
+FileEncoding = Literal["text", "base64"]
 
-class GetFileContentsInput(BaseModel):
+
+class GetFileContentsInput(GitLabInputBase):
     """Input model for retrieving file contents from a GitLab repository.
 
     Attributes:
@@ -17,7 +20,7 @@ class GetFileContentsInput(BaseModel):
     ref: str | None = None
 
 
-class GetFileRawInput(BaseModel):
+class GetFileRawInput(GitLabInputBase):
     """Input model for retrieving raw file contents from a GitLab repository.
 
     Attributes:
@@ -31,7 +34,7 @@ class GetFileRawInput(BaseModel):
     ref: str | None = None
 
 
-class GetFileTreeInput(BaseModel):
+class GetFileTreeInput(GitLabInputBase):
     """Input model for retrieving file tree from a GitLab repository.
 
     Attributes:
@@ -65,7 +68,7 @@ class GitLabContent(GitLabResponseBase):
 
     file_path: str
     content: str
-    encoding: str | None = None
+    encoding: FileEncoding | None = None
     ref: str | None = None
     blob_id: str | None = None
     commit_id: str | None = None
@@ -75,7 +78,7 @@ class GitLabContent(GitLabResponseBase):
     execute_filemode: bool = False
 
 
-class CreateFileInput(BaseModel):
+class CreateFileInput(GitLabInputBase):
     """Input model for creating a file in a GitLab repository.
 
     Attributes:
@@ -92,10 +95,10 @@ class CreateFileInput(BaseModel):
     branch: str
     content: str
     commit_message: str
-    encoding: str = "text"
+    encoding: FileEncoding = "text"
 
 
-class UpdateFileInput(BaseModel):
+class UpdateFileInput(GitLabInputBase):
     """Input model for updating a file in a GitLab repository.
 
     Attributes:
@@ -113,11 +116,11 @@ class UpdateFileInput(BaseModel):
     branch: str
     content: str
     commit_message: str
-    encoding: str = "text"
+    encoding: FileEncoding = "text"
     last_commit_id: str | None = None
 
 
-class DeleteFileInput(BaseModel):
+class DeleteFileInput(GitLabInputBase):
     """Input model for deleting a file from a GitLab repository.
 
     Attributes:
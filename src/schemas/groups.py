@@ -1,11 +1,17 @@
-from enum import Enum
+from enum import IntEnum
 
-from pydantic import BaseModel
+from pydantic import ConfigDict
 
-from src.schemas.base import GitLabResponseBase, PaginatedResponse, VisibilityLevel
+from src.schemas._fields import GroupPath
+from src.schemas.base import (
+    GitLabInputBase,
+    GitLabResponseBase,
+    PaginatedResponse,
+    VisibilityLevel,
+)
 
 
-class GroupAccessLevel(int, Enum):
+class GroupAccessLevel(IntEnum):
     """GitLab group access levels.
 
     Attributes:
@@ -34,6 +40,7 @@ class GitLabGroup(GitLabResponseBase):
         id: The unique identifier of the group.
         name: The name of the group.
         path: The path of the group.
+        full_path: The full path of the group, including parent groups.
         description: Optional description of the group.
         visibility: The visibility level of the group.
         web_url: The web URL of the group.
@@ -44,6 +51,7 @@ class GitLabGroup(GitLabResponseBase):
     id: int
     name: str
     path: str
+    full_path: str | None = None
     description: str | None = None
     visibility: VisibilityLevel
     web_url: str
@@ -51,7 +59,7 @@ class GitLabGroup(GitLabResponseBase):
     labels: list[str] | None = None
 
 
-class ListGroupsInput(BaseModel):
+class ListGroupsInput(GitLabInputBase):
     """Input model for listing GitLab groups.
 
     Lists groups visible to the current user with optional filtering and pagination.
@@ -77,6 +85,9 @@ class ListGroupsInput(BaseModel):
         - List owned groups only: owned=True
     """
 
+    # Keep min_access_level as the raw int; it is only ever sent as a query param
+    model_config = ConfigDict(use_enum_values=True)
+
     search: str | None = None
     owned: bool = False
     min_access_level: GroupAccessLevel | None = None
@@ -90,7 +101,7 @@ class GitLabGroupListResponse(PaginatedResponse[GitLabGroup]):
 
 
 
-class GetGroupInput(BaseModel):
+class GetGroupInput(GitLabInputBase):
     """Input model for getting a specific GitLab group.
 
     Retrieves detailed information about a specific group, optionally including its labels.
@@ -116,7 +127,7 @@ class GetGroupInput(BaseModel):
     with_labels: bool = False
 
 
-class CreateGroupInput(BaseModel):
+class CreateGroupInput(GitLabInputBase):
     """Input model for creating a new GitLab group.
 
     Creates a new group (namespace) that can contain projects and subgroups.
@@ -126,14 +137,15 @@ class CreateGroupInput(BaseModel):
              This is shown in the GitLab UI.
              Examples: 'Backend Team', 'My Company', 'API Development'
         path: The URL path identifier for the group (REQUIRED).
-             Must be lowercase, URL-safe (alphanumeric, hyphens, underscores).
+             Letters, digits, '_', '-' and '.'; must start with a letter, digit
+             or '_' and must not end in '.git' or '.atom'.
              This becomes part of project URLs: gitlab.com/GROUP_PATH/project
              Examples: 'backend-team', 'my-company', 'api-dev'
         description: Optional description of the group's purpose.
                     Supports markdown formatting.
                     Example: 'Team responsible for backend services and APIs.'
         visibility: The visibility level of the group (OPTIONAL).
-                   Values: PRIVATE (default), INTERNAL, PUBLIC
+                   Values: 'private' (default), 'internal', 'public'
                    Affects who can see the group and its projects.
         parent_id: Numeric ID of parent group to create a subgroup (OPTIONAL).
                   Leave empty for top-level group.
@@ -147,14 +159,14 @@ class CreateGroupInput(BaseModel):
     """
 
     name: str
-    path: str
+    path: GroupPath
     description: str | None = None
-    visibility: VisibilityLevel = VisibilityLevel.PRIVATE
+    visibility: VisibilityLevel = "private"
     parent_id: int | None = None
     auto_devops_enabled: bool = False
 
 
-class UpdateGroupInput(BaseModel):
+class UpdateGroupInput(GitLabInputBase):
     """Input model for updating a GitLab group.
 
     Updates properties of an existing group. Only provided fields will be changed.
@@ -165,28 +177,28 @@ class UpdateGroupInput(BaseModel):
         name: New display name for the group (OPTIONAL).
              Examples: 'Updated Team Name', 'Backend Services'
         path: New URL path identifier for the group (OPTIONAL).
-             Must be URL-safe and will change group URLs.
+             Follows the same rules as on creation; changing it changes group URLs.
              WARNING: This affects all project URLs in the group.
              Examples: 'new-team-name', 'backend-services'
         description: New description for the group (OPTIONAL).
                     Pass empty string to clear description.
                     Supports markdown formatting.
         visibility: New visibility level for the group (OPTIONAL).
-                   Values: PRIVATE, INTERNAL, PUBLIC
+                   Values: 'private', 'internal', 'public'
 
     Example Usage:
         - Update name only: group_id='my-group', name='New Team Name'
-        - Change visibility: group_id='123', visibility=VisibilityLevel.PUBLIC
+        - Change visibility: group_id='123', visibility='public'
     """
 
     group_id: str
     name: str | None = None
-    path: str | None = None
+    path: GroupPath | None = None
     description: str | None = None
     visibility: VisibilityLevel | None = None
 
 
-class DeleteGroupInput(BaseModel):
+class DeleteGroupInput(GitLabInputBase):
     """Input model for deleting a GitLab group.
 
     WARNING: This permanently deletes the group and ALL its projects, subgroups, and data.
@@ -205,7 +217,7 @@ class DeleteGroupInput(BaseModel):
     group_id: str
 
 
-class GetGroupByProjectNamespaceInput(BaseModel):
+class GetGroupByProjectNamespaceInput(GitLabInputBase):
     """Input model for getting a GitLab group based on a project namespace.
 
     Extracts and retrieves the group that owns a specific project based on the project's namespace.
@@ -1,11 +1,15 @@
 """GitLab iteration data models."""
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.schemas._fields import GroupId, IterationId, Page
+from src.schemas.base import GitLabInputBase, GitLabResponseBase
 
-class UpdateIterationInput(BaseModel):
+
+class UpdateIterationInput(GitLabInputBase):
     """Input model for updating an existing iteration in GitLab.
 
     Updates properties of an existing iteration. Only provided fields will be changed.
@@ -25,16 +29,18 @@ class UpdateIterationInput(BaseModel):
         - Close iteration: group_id='team', iteration_id=42, state_event='close'
     """
 
-    group_id: str = Field(description="The numeric ID or path of the group")
-    iteration_id: int = Field(description="The numeric ID of the iteration")
+    group_id: GroupId
+    iteration_id: IterationId
     title: str | None = Field(None, description="New title for the iteration")
     description: str | None = Field(None, description="New description for the iteration")
     start_date: str | None = Field(None, description="New start date (YYYY-MM-DD format)")
     due_date: str | None = Field(None, description="New due date (YYYY-MM-DD format)")
-    state_event: str | None = Field(None, description="State change action ('start' or 'close')")
+    state_event: Literal["start", "close"] | None = Field(
+        None, description="State change action ('start' or 'close')"
+    )
 
 
-class ListIterationsInput(BaseModel):
+class ListIterationsInput(GitLabInputBase):
     """Input model for listing iterations in a GitLab group.
 
     Retrieves a paginated list of iterations from a group with optional filtering.
@@ -58,15 +64,17 @@ class ListIterationsInput(BaseModel):
         - Search iterations: group_id='team', search='sprint'
     """
 
-    group_id: str = Field(description="The numeric ID or path of the group")
-    state: str | None = Field(None, description="Filter iterations by state")
+    group_id: GroupId
+    state: Literal["opened", "upcoming", "current", "closed", "all"] | None = Field(
+        None, description="Filter iterations by state"
+    )
     search: str | None = Field(None, description="Search iterations by title")
     include_ancestors: bool | None = Field(None, description="Include iterations from ancestor groups")
-    page: int = Field(1, description="Page number for pagination")
+    page: Page = 1
     per_page: int = Field(20, description="Number of iterations per page")
 
 
-class GetIterationInput(BaseModel):
+class GetIterationInput(GitLabInputBase):
     """Input model for getting a specific iteration from GitLab.
 
     Retrieves detailed information about a specific iteration.
@@ -80,11 +88,11 @@ class GetIterationInput(BaseModel):
         - Get iteration: group_id='team', iteration_id=42
     """
 
-    group_id: str = Field(description="The numeric ID or path of the group")
-    iteration_id: int = Field(description="The numeric ID of the iteration")
+    group_id: GroupId
+    iteration_id: IterationId
 
 
-class DeleteIterationInput(BaseModel):
+class DeleteIterationInput(GitLabInputBase):
     """Input model for deleting an iteration from GitLab.
 
     WARNING: This permanently deletes the iteration and cannot be undone.
@@ -97,11 +105,11 @@ class DeleteIterationInput(BaseModel):
         - Delete iteration: group_id='team', iteration_id=42
     """
 
-    group_id: str = Field(description="The numeric ID or path of the group")
-    iteration_id: int = Field(description="The numeric ID of the iteration")
+    group_id: GroupId
+    iteration_id: IterationId
 
 
-class GitLabIteration(BaseModel):
+class GitLabIteration(GitLabResponseBase):
     """GitLab iteration model."""
 
     id: int = Field(description="Iteration ID")
@@ -118,7 +126,7 @@ class GitLabIteration(BaseModel):
     web_url: str = Field(description="Web URL of the iteration")
 
 
-class IterationListResponse(BaseModel):
+class IterationListResponse(GitLabResponseBase):
     """Response model for iteration list operations."""
 
     iterations: list[GitLabIteration] = Field(description="List of iterations")
@@ -1,9 +1,10 @@
 """Schema definitions for GitLab CI/CD jobs."""
 
-from pydantic import BaseModel
 
+from src.schemas.base import GitLabInputBase, GitLabResponseBase
 
-class JobLogsInput(BaseModel):
+
+class JobLogsInput(GitLabInputBase):
     """Input model for retrieving GitLab CI/CD job logs.
 
     Retrieves the execution logs from a specific CI/CD job run.
@@ -28,7 +29,7 @@ class JobLogsInput(BaseModel):
     job_id: int
 
 
-class JobLogsResponse(BaseModel):
+class JobLogsResponse(GitLabResponseBase):
     """Response model for GitLab CI/CD job logs.
 
     Contains the raw execution logs from a CI/CD job.
@@ -1,8 +1,7 @@
 """Schema models for GitLab labels."""
 
-from pydantic import BaseModel
 
-from src.schemas.base import BaseResponseList, GitLabResponseBase
+from src.schemas.base import BaseResponseList, GitLabInputBase, GitLabResponseBase
 
 
 class GitLabLabel(GitLabResponseBase):
@@ -37,7 +36,7 @@ class GitLabLabel(GitLabResponseBase):
     is_project_label: bool | None = None
 
 
-class ListLabelsInput(BaseModel):
+class ListLabelsInput(GitLabInputBase):
     """Input model for listing GitLab labels.
 
     Lists labels from either a specific project OR group. Exactly one of project_path or group_id must be provided.
@@ -79,7 +78,7 @@ class ListLabelsInput(BaseModel):
     per_page: int = 20
 
 
-class GetLabelInput(BaseModel):
+class GetLabelInput(GitLabInputBase):
     """Input model for getting a specific GitLab label.
 
     Retrieves detailed information about a specific label. Must specify the scope (project or group).
@@ -110,7 +109,7 @@ class GetLabelInput(BaseModel):
     label_id: str
 
 
-class CreateLabelInput(BaseModel):
+class CreateLabelInput(GitLabInputBase):
     """Input model for creating a new GitLab label.
 
     Creates a new label in either a specific project or group.
@@ -150,7 +149,7 @@ class CreateLabelInput(BaseModel):
     priority: int | None = None
 
 
-class UpdateLabelInput(BaseModel):
+class UpdateLabelInput(GitLabInputBase):
     """Input model for updating a GitLab label.
 
     Updates properties of an existing label. At least one update field must be provided.
@@ -194,7 +193,7 @@ class UpdateLabelInput(BaseModel):
     priority: int | None = None
 
 
-class DeleteLabelInput(BaseModel):
+class DeleteLabelInput(GitLabInputBase):
     """Input model for deleting a GitLab label.
 
     WARNING: This permanently deletes the label and removes it from all issues/MRs.
@@ -221,7 +220,7 @@ class DeleteLabelInput(BaseModel):
     label_id: str
 
 
-class SubscribeToLabelInput(BaseModel):
+class SubscribeToLabelInput(GitLabInputBase):
     """Input model for subscribing to a GitLab label.
 
     Subscribe to notifications for issues/MRs that get this label applied.
@@ -242,7 +241,7 @@ class SubscribeToLabelInput(BaseModel):
     label_id: str
 
 
-class UnsubscribeFromLabelInput(BaseModel):
+class UnsubscribeFromLabelInput(GitLabInputBase):
     """Input model for unsubscribing from a GitLab label.
 
     Stop receiving notifications for issues/MRs that get this label applied.
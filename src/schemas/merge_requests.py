@@ -2,9 +2,15 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
-from src.schemas.base import BaseModel, BaseResponseList
+from src.schemas._fields import LabelNames
+from src.schemas.base import (
+    BaseModel,
+    BaseResponseList,
+    GitLabInputBase,
+    GitLabResponseBase,
+)
 
 
 class MergeStatus(str, Enum):
@@ -18,7 +24,12 @@ class MergeStatus(str, Enum):
 
 
 class MergeRequestState(str, Enum):
-    """Enum for merge request states."""
+    """Enum for merge request states.
+
+    Input schemas type ``state`` as a plain string literal so the tool schema
+    stays flat; this enum remains exported for Python callers, whose members
+    still validate against those literals.
+    """
 
     OPENED = "opened"
     CLOSED = "closed"
@@ -35,7 +46,7 @@ class DiffRefs(BaseModel):
     start_sha: str
 
 
-class CreateMergeRequestInput(BaseModel):
+class CreateMergeRequestInput(GitLabInputBase):
     """Input model for creating a merge request in a GitLab repository.
 
     Creates a new merge request to propose changes from one branch to another.
@@ -78,14 +89,14 @@ class CreateMergeRequestInput(BaseModel):
     target_branch: str
     title: str
     description: str | None = None
-    labels: list[str] | None = None
+    labels: LabelNames | None = None
     remove_source_branch: bool | None = None
     allow_collaboration: bool | None = None
     squash: bool | None = None
     merge_after: str | None = None
 
 
-class GitLabMergeRequest(BaseModel):
+class GitLabMergeRequest(GitLabResponseBase):
     """Response model for a GitLab merge request."""
 
     id: int
@@ -93,7 +104,7 @@ class GitLabMergeRequest(BaseModel):
     project_id: int
     title: str
     description: str | None = None
-    state: str
+    state: Literal["opened", "closed", "locked", "merged"]
     target_branch: str
     source_branch: str
     web_url: str
@@ -107,7 +118,7 @@ class GitLabMergeRequest(BaseModel):
     draft: bool = False
 
 
-class ListMergeRequestsInput(BaseModel):
+class ListMergeRequestsInput(GitLabInputBase):
     """Input model for listing merge requests in a GitLab repository.
 
     Retrieves a paginated list of merge requests with optional filtering.
@@ -117,7 +128,7 @@ class ListMergeRequestsInput(BaseModel):
                      Must include complete group/subgroup path.
                      Examples: 'gitlab-org/gitlab', 'my-group/my-project'
         state: Filter merge requests by state (OPTIONAL).
-              Values: OPENED, CLOSED, MERGED, LOCKED, ALL
+              Values: 'opened', 'closed', 'merged', 'locked', 'all'
               Default: Returns all merge requests regardless of state.
         labels: List of label names to filter by (OPTIONAL).
                Only returns MRs that have ALL specified labels.
@@ -130,14 +141,14 @@ class ListMergeRequestsInput(BaseModel):
         per_page: Number of merge requests per page (1-100, default 20).
 
     Example Usage:
-        - List all open MRs: project_path='my/project', state=MergeRequestState.OPENED
+        - List all open MRs: project_path='my/project', state='opened'
         - List MRs to main: project_path='my/project', target_branch='main'
         - List bug fixes: project_path='my/project', labels=['bug']
     """
 
     project_path: str
-    state: MergeRequestState | None = None
-    labels: list[str] | None = None
+    state: Literal["opened", "closed", "locked", "merged", "all"] | None = None
+    labels: LabelNames | None = None
     source_branch: str | None = None
     target_branch: str | None = None
     page: int = 1
@@ -149,7 +160,7 @@ class GitLabMergeRequestListResponse(BaseResponseList[GitLabMergeRequest]):
 
 
 
-class GetMergeRequestInput(BaseModel):
+class GetMergeRequestInput(GitLabInputBase):
     """Input model for getting a specific merge request from a GitLab repository.
 
     Retrieves detailed information about a specific merge request.
@@ -171,7 +182,7 @@ class GetMergeRequestInput(BaseModel):
     mr_iid: int
 
 
-class UpdateMergeRequestInput(BaseModel):
+class UpdateMergeRequestInput(GitLabInputBase):
     """Input model for updating a merge request in GitLab.
 
     Updates properties of an existing merge request. Only provided fields will be changed.
@@ -223,9 +234,9 @@ class UpdateMergeRequestInput(BaseModel):
     target_branch: str | None = None
     assignee_ids: list[int] | None = None
     reviewer_ids: list[int] | None = None
-    labels: list[str] | None = None
-    add_labels: list[str] | None = None
-    remove_labels: list[str] | None = None
+    labels: LabelNames | None = None
+    add_labels: LabelNames | None = None
+    remove_labels: LabelNames | None = None
     remove_source_branch: bool | None = None
     squash: bool | None = None
     discussion_locked: bool | None = None
@@ -233,7 +244,7 @@ class UpdateMergeRequestInput(BaseModel):
     merge_after: str | None = None
 
 
-class MergeMergeRequestInput(BaseModel):
+class MergeMergeRequestInput(GitLabInputBase):
     """Input model for merging a merge request in GitLab.
 
     Merges an approved merge request into the target branch.
@@ -308,7 +319,7 @@ class MergeRequestSuggestion(BaseModel):
     to_content: str
 
 
-class CreateMergeRequestCommentInput(BaseModel):
+class CreateMergeRequestCommentInput(GitLabInputBase):
     """Input model for creating a comment on a GitLab merge request.
 
     Adds a general comment to the merge request discussion.
@@ -334,7 +345,7 @@ class CreateMergeRequestCommentInput(BaseModel):
     body: str
 
 
-class CreateMergeRequestThreadInput(BaseModel):
+class CreateMergeRequestThreadInput(GitLabInputBase):
     """Input model for creating a thread (suggestion) on a GitLab merge request.
 
     Attributes:
@@ -385,28 +396,28 @@ class CreateMergeRequestThreadInput(BaseModel):
         return position
 
 
-class ApplySuggestionInput(BaseModel):
+class ApplySuggestionInput(GitLabInputBase):
     """Input model for applying a suggestion in a GitLab merge request."""
 
     id: int
     commit_message: str | None = None
 
 
-class ApplyMultipleSuggestionsInput(BaseModel):
+class ApplyMultipleSuggestionsInput(GitLabInputBase):
     """Input model for applying multiple suggestions in a GitLab merge request."""
 
     ids: list[int]
     commit_message: str | None = None
 
 
-class GitLabComment(BaseModel):
+class GitLabComment(GitLabResponseBase):
     """Response model for a GitLab comment."""
 
     id: int
     body: str
 
 
-class MergeRequestChanges(BaseModel):
+class MergeRequestChanges(GitLabResponseBase):
     """Response model for merge request changes."""
 
     id: int
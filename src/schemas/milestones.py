@@ -1,11 +1,15 @@
 """GitLab milestone data models."""
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from src.schemas._fields import MilestoneId, OptionalGroupId, OptionalProjectPath, Page
+from src.schemas.base import GitLabInputBase, GitLabResponseBase
 
-class CreateMilestoneInput(BaseModel):
+
+class CreateMilestoneInput(GitLabInputBase):
     """Input model for creating a new milestone in GitLab.
 
     Creates a new milestone within a project or group for organizing issues and merge requests.
@@ -34,15 +38,15 @@ class CreateMilestoneInput(BaseModel):
         - Group milestone: group_id='my-team', title='Q1 Goals', due_date='2024-03-31'
     """
 
-    project_path: str | None = Field(None, description="The full namespace path of the project")
-    group_id: str | None = Field(None, description="The numeric ID or path of the group")
+    project_path: OptionalProjectPath = None
+    group_id: OptionalGroupId = None
     title: str = Field(description="The title of the milestone")
     description: str | None = Field(None, description="The description of the milestone")
     due_date: str | None = Field(None, description="Due date (YYYY-MM-DD format)")
     start_date: str | None = Field(None, description="Start date (YYYY-MM-DD format)")
 
 
-class UpdateMilestoneInput(BaseModel):
+class UpdateMilestoneInput(GitLabInputBase):
     """Input model for updating an existing milestone in GitLab.
 
     Updates properties of an existing milestone. Only provided fields will be changed.
@@ -65,17 +69,19 @@ class UpdateMilestoneInput(BaseModel):
         - Close milestone: group_id='team', milestone_id=42, state_event='close'
     """
 
-    project_path: str | None = Field(None, description="The full namespace path of the project")
-    group_id: str | None = Field(None, description="The numeric ID or path of the group")
-    milestone_id: int = Field(description="The numeric ID of the milestone")
+    project_path: OptionalProjectPath = None
+    group_id: OptionalGroupId = None
+    milestone_id: MilestoneId
     title: str | None = Field(None, description="New title for the milestone")
     description: str | None = Field(None, description="New description for the milestone")
     due_date: str | None = Field(None, description="New due date (YYYY-MM-DD format)")
     start_date: str | None = Field(None, description="New start date (YYYY-MM-DD format)")
-    state_event: str | None = Field(None, description="State change action ('close' or 'activate')")
+    state_event: Literal["close", "activate"] | None = Field(
+        None, description="State change action ('close' or 'activate')"
+    )
 
 
-class ListMilestonesInput(BaseModel):
+class ListMilestonesInput(GitLabInputBase):
     """Input model for listing milestones in GitLab.
 
     Retrieves a paginated list of milestones from a project or group with optional filtering.
@@ -99,15 +105,15 @@ class ListMilestonesInput(BaseModel):
         - Search milestones: project_path='project', search='release'
     """
 
-    project_path: str | None = Field(None, description="The full namespace path of the project")
-    group_id: str | None = Field(None, description="The numeric ID or path of the group")
-    state: str | None = Field(None, description="Filter milestones by state")
+    project_path: OptionalProjectPath = None
+    group_id: OptionalGroupId = None
+    state: Literal["active", "closed", "all"] | None = Field(None, description="Filter milestones by state")
     search: str | None = Field(None, description="Search milestones by title")
-    page: int = Field(1, description="Page number for pagination")
+    page: Page = 1
     per_page: int = Field(20, description="Number of milestones per page")
 
 
-class GetMilestoneInput(BaseModel):
+class GetMilestoneInput(GitLabInputBase):
     """Input model for getting a specific milestone from GitLab.
 
     Retrieves detailed information about a specific milestone.
@@ -124,12 +130,12 @@ class GetMilestoneInput(BaseModel):
         - Get group milestone: group_id='team', milestone_id=42
     """
 
-    project_path: str | None = Field(None, description="The full namespace path of the project")
-    group_id: str | None = Field(None, description="The numeric ID or path of the group")
-    milestone_id: int = Field(description="The numeric ID of the milestone")
+    project_path: OptionalProjectPath = None
+    group_id: OptionalGroupId = None
+    milestone_id: MilestoneId
 
 
-class DeleteMilestoneInput(BaseModel):
+class DeleteMilestoneInput(GitLabInputBase):
     """Input model for deleting a milestone from GitLab.
 
     WARNING: This permanently deletes the milestone and cannot be undone.
@@ -146,12 +152,12 @@ class DeleteMilestoneInput(BaseModel):
         - Delete group milestone: group_id='team', milestone_id=42
     """
 
-    project_path: str | None = Field(None, description="The full namespace path of the project")
-    group_id: str | None = Field(None, description="The numeric ID or path of the group")
-    milestone_id: int = Field(description="The numeric ID of the milestone")
+    project_path: OptionalProjectPath = None
+    group_id: OptionalGroupId = None
+    milestone_id: MilestoneId
 
 
-class GitLabMilestone(BaseModel):
+class GitLabMilestone(GitLabResponseBase):
     """GitLab milestone model with optimized field ordering for Claude Code UX.
 
     CRITICAL: id and title are positioned as first fields for optimal
@@ -163,7 +169,7 @@ class GitLabMilestone(BaseModel):
     id: int = Field(..., description="Milestone ID (shows first in Claude Code)")
     title: str = Field(..., description="Milestone title (shows second in Claude Code)")
     description: str | None = Field(None, description="Milestone description")
-    state: str = Field(description="Milestone state")
+    state: Literal["active", "closed"] = Field(description="Milestone state")
     created_at: datetime = Field(description="Creation timestamp")
     updated_at: datetime = Field(description="Last update timestamp")
     due_date: str | None = Field(None, description="Due date")
@@ -173,7 +179,7 @@ class GitLabMilestone(BaseModel):
     project_id: int | None = Field(None, description="Project ID if project milestone")
 
 
-class MilestoneListResponse(BaseModel):
+class MilestoneListResponse(GitLabResponseBase):
     """Response model for milestone list operations."""
 
     milestones: list[GitLabMilestone] = Field(description="List of milestones")
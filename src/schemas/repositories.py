@@ -1,15 +1,15 @@
 from enum import Enum
 
 from src.schemas.base import (
-    BaseModel,
     BaseResponseList,
+    GitLabInputBase,
     GitLabResponseBase,
     PaginatedResponse,
     VisibilityLevel,
 )
 
 
-class CreateRepositoryInput(BaseModel):
+class CreateRepositoryInput(GitLabInputBase):
     """Input model for creating a new GitLab project/repository.
 
     Creates a new project (GitLab's term for repositories) within a group or user namespace.
@@ -24,9 +24,9 @@ class CreateRepositoryInput(BaseModel):
                     Shown on the project page and in search results.
                     Examples: 'REST API for user management', 'React frontend application'
         visibility: The visibility level of the project (OPTIONAL).
-                   PRIVATE (default) = only members can access
-                   INTERNAL = any authenticated user can access
-                   PUBLIC = anyone can access, including anonymous users
+                   'private' (default) = only members can access
+                   'internal' = any authenticated user can access
+                   'public' = anyone can access, including anonymous users
         initialize_with_readme: Create an initial README.md file (OPTIONAL).
                                true = create README, false (default) = empty repository
         namespace_id: The namespace (group or user) ID to create the project in (OPTIONAL).
@@ -37,12 +37,12 @@ class CreateRepositoryInput(BaseModel):
     Example Usage:
         - Personal project: name='my-app', description='My application'
         - Group project: name='team-app', namespace_id='my-group'
-        - Public project: name='open-source-lib', visibility=VisibilityLevel.PUBLIC, initialize_with_readme=True
+        - Public project: name='open-source-lib', visibility='public', initialize_with_readme=True
     """
 
     name: str
     description: str | None = None
-    visibility: VisibilityLevel = VisibilityLevel.PRIVATE
+    visibility: VisibilityLevel = "private"
     initialize_with_readme: bool = False
     namespace_id: str | int | None = None
 
@@ -99,7 +99,7 @@ class TreeItemType(str, Enum):
     TREE = "tree"
 
 
-class ListRepositoryTreeInput(BaseModel):
+class ListRepositoryTreeInput(GitLabInputBase):
     """Input model for listing files and directories in a repository.
 
     Attributes:
@@ -139,7 +139,7 @@ class RepositoryTreeResponse(BaseResponseList[RepositoryTreeItem]):
 
 
 
-class SearchProjectsInput(BaseModel):
+class SearchProjectsInput(GitLabInputBase):
     """Input model for searching GitLab projects.
 
     Attributes:
@@ -153,7 +153,7 @@ class SearchProjectsInput(BaseModel):
     per_page: int = 20
 
 
-class GetRepositoryInput(BaseModel):
+class GetRepositoryInput(GitLabInputBase):
     """Input model for getting a specific repository.
 
     Attributes:
@@ -163,7 +163,7 @@ class GetRepositoryInput(BaseModel):
     project_path: str
 
 
-class ListRepositoriesInput(BaseModel):
+class ListRepositoriesInput(GitLabInputBase):
     """Input model for listing repositories.
 
     Attributes:
@@ -183,7 +183,7 @@ class ListRepositoriesInput(BaseModel):
     group_id: str | None = None
 
 
-class UpdateRepositoryInput(BaseModel):
+class UpdateRepositoryInput(GitLabInputBase):
     """Input model for updating a repository.
 
     Attributes:
@@ -201,7 +201,7 @@ class UpdateRepositoryInput(BaseModel):
     default_branch: str | None = None
 
 
-class DeleteRepositoryInput(BaseModel):
+class DeleteRepositoryInput(GitLabInputBase):
     """Input model for deleting a repository.
 
     Attributes:
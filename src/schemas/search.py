@@ -8,6 +8,10 @@ from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field, field_validator
 
+from src.schemas._fields import ProjectInfo
+from src.schemas.base import GitLabResponseBase, GitLabUserRef
+from src.schemas.commits import CommitStats
+
 
 class SearchScope(str, Enum):
     """Enumeration of valid search scopes in GitLab.
@@ -139,7 +143,7 @@ class ProjectSearchRequest(SearchRequest):
     )
 
 
-class SearchResult(BaseModel):
+class SearchResult(GitLabResponseBase):
     """Base class for search results."""
 
 
@@ -163,7 +167,7 @@ class ProjectSearchResult(SearchResult):
     path_with_namespace: str
     created_at: str
     default_branch: str
-    topics: list[str] = []
+    topics: tuple[str, ...] = ()
     ssh_url_to_repo: str
     http_url_to_repo: str
     web_url: str
@@ -192,7 +196,7 @@ class BlobSearchResult(SearchResult):
     project_id: int | None = Field(None, description="Project ID containing the file")
 
     # Enhanced contextual fields
-    project: dict[str, Any] | None = Field(None, description="Project information including name and namespace")
+    project: ProjectInfo = None
     blob_url: str | None = Field(None, description="Direct URL to view the blob")
     repository_url: str | None = Field(None, description="Repository URL")
     commit_id: str | None = Field(None, description="Latest commit ID for this file")
@@ -221,15 +225,15 @@ class IssueSearchResult(SearchResult):
     created_at: str
     updated_at: str
     web_url: str
-    author: dict[str, Any] | None = None
-    labels: list[str] = []
-    assignees: list[dict[str, Any]] = []
+    author: GitLabUserRef | None = None
+    labels: tuple[str, ...] = ()
+    assignees: tuple[GitLabUserRef, ...] = ()
 
     # Enhanced contextual fields
-    project: dict[str, Any] | None = Field(None, description="Project information including name and namespace")
+    project: ProjectInfo = None
     milestone: dict[str, Any] | None = Field(None, description="Milestone information if assigned")
     closed_at: str | None = Field(None, description="Issue close date if closed")
-    assignee: dict[str, Any] | None = Field(None, description="Primary assignee (legacy field)")
+    assignee: GitLabUserRef | None = Field(None, description="Primary assignee (legacy field)")
     confidential: bool = Field(False, description="Whether the issue is confidential")
     discussion_locked: bool | None = Field(None, description="Whether discussion is locked")
     due_date: str | None = Field(None, description="Issue due date if set")
@@ -260,18 +264,18 @@ class MergeRequestSearchResult(SearchResult):
     created_at: str
     updated_at: str
     web_url: str
-    author: dict[str, Any] | None = None
-    labels: list[str] = []
-    assignees: list[dict[str, Any]] = []
+    author: GitLabUserRef | None = None
+    labels: tuple[str, ...] = ()
+    assignees: tuple[GitLabUserRef, ...] = ()
     source_branch: str | None = None
     target_branch: str | None = None
 
     # Enhanced contextual fields
-    project: dict[str, Any] | None = Field(None, description="Project information including name and namespace")
+    project: ProjectInfo = None
     milestone: dict[str, Any] | None = Field(None, description="Milestone information if assigned")
     merged_at: str | None = Field(None, description="Merge date if merged")
     closed_at: str | None = Field(None, description="Close date if closed")
-    assignee: dict[str, Any] | None = Field(None, description="Primary assignee (legacy field)")
+    assignee: GitLabUserRef | None = Field(None, description="Primary assignee (legacy field)")
     merge_status: str | None = Field(None, description="Merge status (can_be_merged, cannot_be_merged, etc.)")
     merge_when_pipeline_succeeds: bool = Field(False, description="Auto-merge when pipeline succeeds")
     draft: bool = Field(False, description="Whether the MR is a draft")
@@ -323,13 +327,13 @@ class CommitSearchResult(SearchResult):
     project_id: int | None = Field(None, description="Project ID containing the commit")
 
     # Enhanced contextual fields
-    project: dict[str, Any] | None = Field(None, description="Project information including name and namespace")
+    project: ProjectInfo = None
     committer_name: str | None = Field(None, description="Committer name if different from author")
     committer_email: str | None = Field(None, description="Committer email if different from author")
     committed_date: str | None = Field(None, description="Commit date (may differ from created_at)")
     authored_date: str | None = Field(None, description="Author date (may differ from created_at)")
     parent_ids: list[str] = Field([], description="Parent commit SHAs")
-    stats: dict[str, Any] | None = Field(None, description="Commit statistics (additions, deletions, total)")
+    stats: CommitStats | None = Field(None, description="Commit statistics (additions, deletions, total)")
     pipeline: dict[str, Any] | None = Field(None, description="Associated pipeline information")
     trailers: dict[str, Any] | None = Field(None, description="Git trailers (Signed-off-by, etc.)")
     extended_trailers: dict[str, Any] | None = Field(None, description="Extended trailer information")
@@ -374,19 +378,19 @@ class NoteSearchResult(SearchResult):
     # Basic fields
     created_at: str = Field(..., description="Note creation timestamp")
     updated_at: str = Field(..., description="Note last update timestamp")
-    author: dict[str, Any] | None = Field(None, description="Note author information")
+    author: GitLabUserRef | None = Field(None, description="Note author information")
 
     # Context information
     noteable_type: str | None = Field(None, description="Type of object the note is attached to (Issue, MergeRequest, etc.)")
     noteable_id: int | None = Field(None, description="ID of the object the note is attached to")
 
     # Enhanced contextual fields
-    project: dict[str, Any] | None = Field(None, description="Project information including name and namespace")
+    project: ProjectInfo = None
     noteable: dict[str, Any] | None = Field(None, description="Full information about the object being commented on")
     system: bool = Field(False, description="Whether this is a system-generated note")
     resolvable: bool = Field(False, description="Whether the note can be resolved")
     resolved: bool = Field(False, description="Whether the note has been resolved")
-    resolved_by: dict[str, Any] | None = Field(None, description="User who resolved the note")
+    resolved_by: GitLabUserRef | None = Field(None, description="User who resolved the note")
     resolved_at: str | None = Field(None, description="When the note was resolved")
     confidential: bool = Field(False, description="Whether the note is confidential")
     internal: bool = Field(False, description="Whether the note is internal only")
@@ -396,9 +400,9 @@ class NoteSearchResult(SearchResult):
     type: str | None = Field(None, description="Note type (DiscussionNote, etc.)")
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(GitLabResponseBase):
     """Generic search response containing only project and blob results."""
 
-    projects: list[ProjectSearchResult] = []
-    blobs: list[BlobSearchResult] = []
-    wiki_blobs: list[BlobSearchResult] = []
+    projects: list[ProjectSearchResult] = Field(default_factory=list)
+    blobs: list[BlobSearchResult] = Field(default_factory=list)
+    wiki_blobs: list[BlobSearchResult] = Field(default_factory=list)
@@ -10,11 +10,11 @@ fields are positioned first for optimal display in collapsed views.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal, TypedDict
 
 from pydantic import BaseModel, Field
 
-from .base import GitLabResponseBase
+from .base import GitLabInputBase, GitLabResponseBase, GitLabUserRef
 
 
 class WorkItemType(str, Enum):
@@ -42,6 +42,31 @@ class WorkItemState(str, Enum):
     CLOSED = "CLOSED"
 
 
+class WorkItemTypeRef(TypedDict):
+    """Work item type as selected in nested GraphQL work items."""
+
+    name: str
+
+
+class WorkItemRef(TypedDict, total=False):
+    """Parent or child work item as returned by the hierarchy widget."""
+
+    id: str
+    iid: str
+    title: str
+    webUrl: str
+    workItemType: WorkItemTypeRef
+
+
+class WorkItemLabelRef(TypedDict, total=False):
+    """Label as returned by the labels widget."""
+
+    id: str
+    title: str
+    color: str
+    description: str | None
+
+
 class WorkItemWidget(BaseModel):
     """Base widget model for Work Items.
 
@@ -60,14 +85,14 @@ class WorkItemAssigneeWidget(WorkItemWidget):
 class WorkItemHierarchyWidget(WorkItemWidget):
     """Hierarchy widget for parent/child relationships."""
     type: str = "HIERARCHY"
-    parent: dict[str, Any] | None = None
-    children: list[dict[str, Any]] = Field(default_factory=list)
+    parent: WorkItemRef | None = None
+    children: list[WorkItemRef] = Field(default_factory=list)
 
 
 class WorkItemLabelsWidget(WorkItemWidget):
     """Labels widget for Work Items."""
     type: str = "LABELS"
-    labels: list[dict[str, Any]] = Field(default_factory=list)
+    labels: list[WorkItemLabelRef] = Field(default_factory=list)
 
 
 class WorkItemMilestoneWidget(WorkItemWidget):
@@ -166,7 +191,7 @@ class GitLabWorkItem(GitLabResponseBase):
     closed_at: datetime | None = Field(None, alias="closedAt")
 
     # User relationships
-    author: dict[str, Any]
+    author: GitLabUserRef
 
     # URLs and references
     web_url: str = Field(..., alias="webUrl")
@@ -199,21 +224,21 @@ class GitLabWorkItem(GitLabResponseBase):
             return assignee_widget.assignees
         return []
 
-    def get_labels(self) -> list[dict[str, Any]]:
+    def get_labels(self) -> list[WorkItemLabelRef]:
         """Get labels from the labels widget."""
         labels_widget = self.get_widget("LABELS")
         if isinstance(labels_widget, WorkItemLabelsWidget):
             return labels_widget.labels
         return []
 
-    def get_parent(self) -> dict[str, Any] | None:
+    def get_parent(self) -> WorkItemRef | None:
         """Get parent work item from hierarchy widget."""
         hierarchy_widget = self.get_widget("HIERARCHY")
         if isinstance(hierarchy_widget, WorkItemHierarchyWidget):
             return hierarchy_widget.parent
         return None
 
-    def get_children(self) -> list[dict[str, Any]]:
+    def get_children(self) -> list[WorkItemRef]:
         """Get child work items from hierarchy widget."""
         hierarchy_widget = self.get_widget("HIERARCHY")
         if isinstance(hierarchy_widget, WorkItemHierarchyWidget):
@@ -221,7 +246,7 @@ class GitLabWorkItem(GitLabResponseBase):
         return []
 
 
-class CreateWorkItemInput(BaseModel):
+class CreateWorkItemInput(GitLabInputBase):
     """Input model for creating Work Items via GraphQL.
 
     Creates new work items using GitLab's unified Work Items API.
@@ -313,7 +338,7 @@ class DatesWidgetOperation(BaseModel):
     due_date: str | None = Field(None, description="Due date (YYYY-MM-DD format), null to clear")
 
 
-class UpdateWorkItemInput(BaseModel):
+class UpdateWorkItemInput(GitLabInputBase):
     """Input model for updating Work Items via GraphQL.
 
     Updates existing work items using widget-based operations.
@@ -336,7 +361,9 @@ class UpdateWorkItemInput(BaseModel):
 
     id: str = Field(..., description="Global Work Item ID")
     title: str | None = Field(None, description="New title")
-    state_event: str | None = Field(None, description="State change action")
+    state_event: Literal["close", "reopen", "CLOSE", "REOPEN"] | None = Field(
+        None, description="State change action"
+    )
     confidential: bool | None = Field(None, description="Change confidentiality")
 
     # Widget update operations (structured)
@@ -349,7 +376,7 @@ class UpdateWorkItemInput(BaseModel):
     description_widget: dict[str, Any] | None = Field(None, description="Description widget operations")
 
 
-class DeleteWorkItemInput(BaseModel):
+class DeleteWorkItemInput(GitLabInputBase):
     """Input model for deleting Work Items.
 
     WARNING: This permanently deletes the work item and cannot be undone.
@@ -361,7 +388,7 @@ class DeleteWorkItemInput(BaseModel):
     id: str = Field(..., description="Global Work Item ID to delete")
 
 
-class GetWorkItemInput(BaseModel):
+class GetWorkItemInput(GitLabInputBase):
     """Input model for getting a specific Work Item.
 
     Attributes:
@@ -377,7 +404,7 @@ class GetWorkItemInput(BaseModel):
     namespace_path: str | None = Field(None, description="Namespace path (for group items)")
 
 
-class ListWorkItemsInput(BaseModel):
+class ListWorkItemsInput(GitLabInputBase):
     """Input model for listing Work Items.
 
     Attributes:
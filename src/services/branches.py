@@ -4,6 +4,7 @@ from typing import cast
 
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
+from src.schemas.base import list_adapter
 from src.schemas.branches import (
     CreateBranchInput,
     DeleteBranchInput,
@@ -48,20 +49,18 @@ async def create_branch(input_model: CreateBranchInput) -> GitLabReference:
                 GitLabErrorType.INVALID_REQUEST,
                 {"message": f"Branch {input_model.branch_name} already exists"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to create branch {input_model.branch_name}",
-                "operation": "create_branch",
-            },
+            "create_branch",
+            f"Failed to create branch {input_model.branch_name}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error during branch creation",
-                "operation": "create_branch",
-            },
+            "create_branch",
+            "Internal error during branch creation",
+            exc,
         ) from exc
 
 
@@ -86,20 +85,18 @@ async def get_default_branch_ref(input_model: GetDefaultBranchRefInput) -> str:
         data = await gitlab_rest_client.get_async(endpoint)
         return cast(str, data["default_branch"])
     except GitLabAPIError as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": "Failed to get default branch",
-                "operation": "get_default_branch",
-            },
+            "get_default_branch",
+            "Failed to get default branch",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error getting default branch",
-                "operation": "get_default_branch",
-            },
+            "get_default_branch",
+            "Internal error getting default branch",
+            exc,
         ) from exc
 
 
@@ -128,22 +125,22 @@ async def list_branches(input_model: ListBranchesInput) -> list[GitLabReference]
         if input_model.search:
             params["search"] = input_model.search
 
-        data = await gitlab_rest_client.get_async(endpoint, params=params)
-
-        branches = [GitLabReference(**branch) for branch in data]
-        return branches
+        return await gitlab_rest_client.get_validated_async(
+            endpoint, list_adapter(GitLabReference), params=params
+        )
     except GitLabAPIError as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {"message": "Failed to list branches", "operation": "list_branches"},
+            "list_branches",
+            "Failed to list branches",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error listing branches",
-                "operation": "list_branches",
-            },
+            "list_branches",
+            "Internal error listing branches",
+            exc,
         ) from exc
 
 
@@ -175,17 +172,18 @@ async def get_branch(input_model: GetBranchInput) -> GitLabReference:
                 GitLabErrorType.NOT_FOUND,
                 {"message": f"Branch {input_model.branch_name} not found"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to get branch {input_model.branch_name}",
-                "operation": "get_branch",
-            },
+            "get_branch",
+            f"Failed to get branch {input_model.branch_name}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {"message": "Internal error getting branch", "operation": "get_branch"},
+            "get_branch",
+            "Internal error getting branch",
+            exc,
         ) from exc
 
 
@@ -212,20 +210,18 @@ async def delete_branch(input_model: DeleteBranchInput) -> bool:
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             return False
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to delete branch {input_model.branch_name}",
-                "operation": "delete_branch",
-            },
+            "delete_branch",
+            f"Failed to delete branch {input_model.branch_name}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error deleting branch",
-                "operation": "delete_branch",
-            },
+            "delete_branch",
+            "Internal error deleting branch",
+            exc,
         ) from exc
 
 
@@ -250,20 +246,18 @@ async def delete_merged_branches(input_model: DeleteMergedBranchesInput) -> bool
         await gitlab_rest_client.delete_async(endpoint)
         return True
     except GitLabAPIError as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": "Failed to delete merged branches",
-                "operation": "delete_merged_branches",
-            },
+            "delete_merged_branches",
+            "Failed to delete merged branches",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error deleting merged branches",
-                "operation": "delete_merged_branches",
-            },
+            "delete_merged_branches",
+            "Internal error deleting merged branches",
+            exc,
         ) from exc
 
 
@@ -305,20 +299,18 @@ async def protect_branch(input_model: ProtectBranchInput) -> bool:
     except GitLabAPIError as exc:
         if "already protected" in str(exc).lower():
             return False
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to protect branch {input_model.branch_name}",
-                "operation": "protect_branch",
-            },
+            "protect_branch",
+            f"Failed to protect branch {input_model.branch_name}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error protecting branch",
-                "operation": "protect_branch",
-            },
+            "protect_branch",
+            "Internal error protecting branch",
+            exc,
         ) from exc
 
 
@@ -345,18 +337,16 @@ async def unprotect_branch(input_model: UnprotectBranchInput) -> bool:
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             return False
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to unprotect branch {input_model.branch_name}",
-                "operation": "unprotect_branch",
-            },
+            "unprotect_branch",
+            f"Failed to unprotect branch {input_model.branch_name}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error unprotecting branch",
-                "operation": "unprotect_branch",
-            },
+            "unprotect_branch",
+            "Internal error unprotecting branch",
+            exc,
         ) from exc
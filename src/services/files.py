@@ -1,6 +1,7 @@
 """Service functions for interacting with GitLab repository files using the REST API."""
 
 import base64
+from collections import OrderedDict
 
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
@@ -15,6 +16,36 @@ from src.schemas.files import (
     UpdateFileInput,
 )
 
+DECODED_CONTENT_CACHE_SIZE = 128
+MAX_CACHED_CONTENT_SIZE = 1024 * 1024
+
+_decoded_contents: OrderedDict[str, str] = OrderedDict()
+
+
+def _decode_content(data: GitLabContent) -> str:
+    """Base64-decode file content, reusing the result for blobs seen before.
+
+    A blob ID names the exact file bytes, so the decoded text can be shared
+    between repeated fetches and between paths or refs with identical content.
+
+    Args:
+        data: The validated file response with base64 encoded content.
+
+    Returns:
+        str: The decoded file content.
+    """
+    key = data.blob_id
+    if key is not None and (content := _decoded_contents.get(key)) is not None:
+        _decoded_contents.move_to_end(key)
+        return content
+
+    content = base64.b64decode(data.content).decode("utf-8")
+    if key is not None and len(data.content) <= MAX_CACHED_CONTENT_SIZE:
+        _decoded_contents[key] = content
+        if len(_decoded_contents) > DECODED_CONTENT_CACHE_SIZE:
+            _decoded_contents.popitem(last=False)
+    return content
+
 
 async def get_file_contents(input_model: GetFileContentsInput) -> GitLabContent:
     """Retrieve the contents of a file from a GitLab repository using the REST API.
@@ -38,22 +69,17 @@ async def get_file_contents(input_model: GetFileContentsInput) -> GitLabContent:
         endpoint = f"/projects/{project_path}/repository/files/{file_path}"
         params = {"ref": ref}
 
-        data = await gitlab_rest_client.get_async(endpoint, params=params)
+        data = await gitlab_rest_client.get_model_async(
+            endpoint, GitLabContent, params=params
+        )
 
         # GitLab API returns base64 encoded content
-        content = base64.b64decode(data["content"]).decode("utf-8")
-
-        return GitLabContent(
-            file_path=data["file_path"],
-            content=content,
-            encoding=data.get("encoding", "base64"),
-            ref=ref,
-            blob_id=data.get("blob_id"),
-            commit_id=data.get("commit_id"),
-            last_commit_id=data.get("last_commit_id"),
-            content_sha256=data.get("content_sha256"),
-            size=data.get("size"),
-            execute_filemode=data.get("execute_filemode", False),
+        return data.model_copy(
+            update={
+                "content": _decode_content(data),
+                "encoding": data.encoding or "base64",
+                "ref": ref,
+            }
         )
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
@@ -61,20 +87,18 @@ async def get_file_contents(input_model: GetFileContentsInput) -> GitLabContent:
                 GitLabErrorType.NOT_FOUND,
                 {"message": f"File {input_model.file_path} not found"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to get file content for {input_model.file_path}",
-                "operation": "get_file_contents",
-            },
+            "get_file_contents",
+            f"Failed to get file content for {input_model.file_path}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error retrieving file content",
-                "operation": "get_file_contents",
-            },
+            "get_file_contents",
+            "Internal error retrieving file content",
+            exc,
         ) from exc
 
 
@@ -111,20 +135,18 @@ async def get_file_raw(input_model: GetFileRawInput) -> str:
                 GitLabErrorType.NOT_FOUND,
                 {"message": f"File {input_model.file_path} not found"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to get raw file content for {input_model.file_path}",
-                "operation": "get_file_raw",
-            },
+            "get_file_raw",
+            f"Failed to get raw file content for {input_model.file_path}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error retrieving raw file content",
-                "operation": "get_file_raw",
-            },
+            "get_file_raw",
+            "Internal error retrieving raw file content",
+            exc,
         ) from exc
 
 
@@ -164,20 +186,18 @@ async def get_file_tree(input_model: GetFileTreeInput) -> list[dict]:
                 GitLabErrorType.NOT_FOUND,
                 {"message": f"Path {input_model.path or '/'} not found"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to get file tree for path {input_model.path or '/'}",
-                "operation": "get_file_tree",
-            },
+            "get_file_tree",
+            f"Failed to get file tree for path {input_model.path or '/'}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {
-                "message": "Internal error retrieving file tree",
-                "operation": "get_file_tree",
-            },
+            "get_file_tree",
+            "Internal error retrieving file tree",
+            exc,
         ) from exc
 
 
@@ -226,17 +246,18 @@ async def create_file(input_model: CreateFileInput) -> FileOperationResponse:
                 GitLabErrorType.INVALID_REQUEST,
                 {"message": f"File {input_model.file_path} already exists"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to create file {input_model.file_path}",
-                "operation": "create_file",
-            },
+            "create_file",
+            f"Failed to create file {input_model.file_path}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {"message": "Internal error creating file", "operation": "create_file"},
+            "create_file",
+            "Internal error creating file",
+            exc,
         ) from exc
 
 
@@ -283,17 +304,18 @@ async def update_file(input_model: UpdateFileInput) -> FileOperationResponse:
                 GitLabErrorType.NOT_FOUND,
                 {"message": f"File {input_model.file_path} not found"},
             ) from exc
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to update file {input_model.file_path}",
-                "operation": "update_file",
-            },
+            "update_file",
+            f"Failed to update file {input_model.file_path}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {"message": "Internal error updating file", "operation": "update_file"},
+            "update_file",
+            "Internal error updating file",
+            exc,
         ) from exc
 
 
@@ -325,15 +347,16 @@ async def delete_file(input_model: DeleteFileInput) -> bool:
         error_msg = str(exc).lower()
         if any(phrase in error_msg for phrase in ["not exist", "not found", "doesn't exist"]):
             return False
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.REQUEST_FAILED,
-            {
-                "message": f"Failed to delete file {input_model.file_path}",
-                "operation": "delete_file",
-            },
+            "delete_file",
+            f"Failed to delete file {input_model.file_path}",
+            exc,
         ) from exc
     except Exception as exc:
-        raise GitLabAPIError(
+        raise GitLabAPIError.for_operation(
             GitLabErrorType.SERVER_ERROR,
-            {"message": "Internal error deleting file", "operation": "delete_file"},
+            "delete_file",
+            "Internal error deleting file",
+            exc,
         ) from exc
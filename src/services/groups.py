@@ -1,7 +1,11 @@
 """Service functions for interacting with GitLab groups using the REST API."""
 
+import time
+from collections import OrderedDict
+
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
+from src.schemas.base import list_adapter
 from src.schemas.groups import (
     GetGroupByProjectNamespaceInput,
     GetGroupInput,
@@ -20,6 +24,85 @@ from src.schemas.labels import (
 )
 from src.services import labels
 
+# Groups change rarely, so get_group answers repeated lookups from memory for a
+# short while instead of revalidating with GitLab on every tool call.
+GROUP_CACHE_TTL = 60.0
+GROUP_CACHE_SIZE = 256
+
+_group_cache: OrderedDict[tuple[str, bool], tuple[float, GitLabGroup]] = OrderedDict()
+
+
+def _cached_group(key: tuple[str, bool]) -> GitLabGroup | None:
+    """Return a cached group if it has not expired.
+
+    Args:
+        key: The (group_id, with_labels) lookup key.
+
+    Returns:
+        GitLabGroup | None: The cached group, or None on a miss.
+    """
+    entry = _group_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, group = entry
+    if expires_at <= time.monotonic():
+        del _group_cache[key]
+        return None
+    _group_cache.move_to_end(key)
+    return group
+
+
+def _group_spellings(group_id: str, group: GitLabGroup) -> set[str]:
+    """Collect the identifiers a group can be looked up by.
+
+    Args:
+        group_id: The group ID or path the group was requested with.
+        group: The fetched group.
+
+    Returns:
+        set[str]: The requested identifier, the numeric ID and the full path.
+    """
+    spellings = {group_id, str(group.id)}
+    if group.full_path:
+        spellings.add(group.full_path)
+    return spellings
+
+
+def _remember_group(key: tuple[str, bool], group: GitLabGroup) -> None:
+    """Cache a fetched group, evicting the least recently used entries when full.
+
+    The group is stored under its numeric ID and full path as well as the
+    identifier it was requested with, so invalidation by either one drops all.
+
+    Args:
+        key: The (group_id, with_labels) lookup key.
+        group: The group to cache.
+    """
+    group_id, with_labels = key
+    entry = (time.monotonic() + GROUP_CACHE_TTL, group)
+    for spelling in _group_spellings(group_id, group):
+        _group_cache[spelling, with_labels] = entry
+        _group_cache.move_to_end((spelling, with_labels))
+    while len(_group_cache) > GROUP_CACHE_SIZE:
+        _group_cache.popitem(last=False)
+
+
+def _forget_group(group_id: str) -> None:
+    """Drop cached lookups of a group under every identifier, with and without labels.
+
+    Args:
+        group_id: The group ID or path as passed to the label service.
+    """
+    spellings = {group_id}
+    for with_labels in (False, True):
+        entry = _group_cache.get((group_id, with_labels))
+        if entry is not None:
+            spellings |= _group_spellings(group_id, entry[1])
+
+    for spelling in spellings:
+        for with_labels in (False, True):
+            _group_cache.pop((spelling, with_labels), None)
+
 
 async def list_groups(input_model: ListGroupsInput) -> GitLabGroupListResponse:
     """List GitLab groups using the REST API.
@@ -45,25 +128,22 @@ async def list_groups(input_model: ListGroupsInput) -> GitLabGroupListResponse:
         params["search"] = input_model.search
     if input_model.owned:
         params["owned"] = "true"
-    if input_model.min_access_level:
-        params["min_access_level"] = str(input_model.min_access_level.value)
+    if input_model.min_access_level is not None:
+        params["min_access_level"] = input_model.min_access_level
     if input_model.top_level_only:
         params["top_level_only"] = "true"
 
     try:
-        # Make the API call
-        response_data = await gitlab_rest_client.get_async("/groups", params=params)
+        # Make the API call, validating the response into our schema
+        items = await gitlab_rest_client.get_validated_async(
+            "/groups", list_adapter(GitLabGroup), params=params
+        )
 
         # Get total count - in a real implementation we would use the headers
         # For now, just use the length of the response
-        total_count = len(response_data)
-
-        # Parse the response into our schema
-        items = [GitLabGroup.model_validate(group) for group in response_data]
-
-        return GitLabGroupListResponse(
+        return GitLabGroupListResponse.model_construct(
             items=items,
-            count=total_count,
+            count=len(items),
         )
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
@@ -85,32 +165,35 @@ async def get_group(input_model: GetGroupInput) -> GitLabGroup:
     Raises:
         GitLabAPIError: If the group does not exist or if retrieving the group fails.
     """
+    key = (input_model.group_id, input_model.with_labels)
+    if (cached := _cached_group(key)) is not None:
+        return cached
+
     # Encode the group ID/path
     group_id = gitlab_rest_client._encode_path_parameter(input_model.group_id)
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.get_async(f"/groups/{group_id}")
-
-        # Parse the response into our schema
-        group = GitLabGroup.model_validate(response)
+        # Make the API call, validating the response into our schema
+        group = await gitlab_rest_client.get_model_async(f"/groups/{group_id}", GitLabGroup)
 
         # If labels are requested, fetch them separately
         if input_model.with_labels:
             try:
                 label_input = ListLabelsInput(group_id=input_model.group_id, per_page=100)
                 labels_response = await list_group_labels(label_input)
-                group.labels = [label.name for label in labels_response.items]
+                labels = [label.name for label in labels_response.items]
             except GitLabAPIError as exc:
                 # Check if it's a 404 (not found) - this is expected for groups with no labels
                 if exc.error_type == GitLabErrorType.NOT_FOUND:
                     # Group exists but has no labels - this is normal
-                    group.labels = []
+                    labels = []
                 else:
                     # For other errors (auth, server errors, etc.), re-raise the original error
                     # Don't wrap it to avoid recursive error messages
                     raise exc
+            group = group.model_copy(update={"labels": labels})
 
+        _remember_group(key, group)
         return group
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
@@ -141,16 +224,19 @@ async def get_group_by_project_namespace(
         GroupNamespaceError: If retrieving the group for the namespace fails.
         GitLabAPIError: If retrieving the group fails for other reasons.
     """
-    # In GitLab, the project namespace is the group path or subgroup path
-    # We'll encode it as a path parameter
+    # In GitLab, the project namespace is the group path or subgroup path, so
+    # sibling projects resolve through the same cache entry as get_group
+    key = (input_model.project_namespace, False)
+    if (cached := _cached_group(key)) is not None:
+        return cached
+
     namespace = gitlab_rest_client._encode_path_parameter(input_model.project_namespace)
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.get_async(f"/groups/{namespace}")
-
-        # Parse the response into our schema
-        return GitLabGroup.model_validate(response)
+        # Make the API call, validating the response into our schema
+        group = await gitlab_rest_client.get_model_async(f"/groups/{namespace}", GitLabGroup)
+        _remember_group(key, group)
+        return group
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
@@ -237,7 +323,9 @@ async def create_group_label(input_model: CreateLabelInput) -> GitLabLabel:
             code=400,
         )
 
-    return await labels.create_label(input_model)
+    label = await labels.create_label(input_model)
+    _forget_group(input_model.group_id)
+    return label
 
 
 async def update_group_label(input_model: UpdateLabelInput) -> GitLabLabel:
@@ -259,7 +347,9 @@ async def update_group_label(input_model: UpdateLabelInput) -> GitLabLabel:
             code=400,
         )
 
-    return await labels.update_label(input_model)
+    label = await labels.update_label(input_model)
+    _forget_group(input_model.group_id)
+    return label
 
 
 async def delete_group_label(input_model: DeleteLabelInput) -> None:
@@ -279,5 +369,6 @@ async def delete_group_label(input_model: DeleteLabelInput) -> None:
         )
 
     await labels.delete_label(input_model)
+    _forget_group(input_model.group_id)
 
 
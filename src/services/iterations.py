@@ -3,6 +3,7 @@
 from typing import Any
 
 from ..api.rest_client import GitLabRestClient
+from ..schemas.base import list_adapter
 from ..schemas.iterations import (
     DeleteIterationInput,
     GetIterationInput,
@@ -34,10 +35,11 @@ class GitLabIterationService:
             params["include_ancestors"] = input_data.include_ancestors
 
         endpoint = f"/groups/{input_data.group_id}/iterations"
-        response = await self.client.get_async(endpoint, params=params)
-        iterations = [GitLabIteration(**iteration) for iteration in response]
+        iterations = await self.client.get_validated_async(
+            endpoint, list_adapter(GitLabIteration), params=params
+        )
 
-        return IterationListResponse(
+        return IterationListResponse.model_construct(
             iterations=iterations,
             count=len(iterations)
         )
@@ -45,8 +47,7 @@ class GitLabIterationService:
     async def get_iteration(self, input_data: GetIterationInput) -> GitLabIteration:
         """Get details for a specific iteration."""
         endpoint = f"/groups/{input_data.group_id}/iterations/{input_data.iteration_id}"
-        response = await self.client.get_async(endpoint)
-        return GitLabIteration(**response)
+        return await self.client.get_model_async(endpoint, GitLabIteration)
 
     async def update_iteration(self, input_data: UpdateIterationInput) -> GitLabIteration:
         """Update an existing iteration."""
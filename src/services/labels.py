@@ -2,6 +2,7 @@
 
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
+from src.schemas.base import list_adapter
 from src.schemas.labels import (
     CreateLabelInput,
     DeleteLabelInput,
@@ -62,13 +63,12 @@ async def list_labels(input_model: ListLabelsInput) -> GitLabLabelListResponse:
         params["with_counts"] = "true"
 
     try:
-        # Make the API call
-        response_data = await gitlab_rest_client.get_async(endpoint, params=params)
-
-        # Parse the response into our schema
-        items = [GitLabLabel.model_validate(label) for label in response_data]
+        # Make the API call, validating the response into our schema
+        items = await gitlab_rest_client.get_validated_async(
+            endpoint, list_adapter(GitLabLabel), params=params
+        )
 
-        return GitLabLabelListResponse(items=items)
+        return GitLabLabelListResponse.model_construct(items=items)
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
     except Exception as exc:
@@ -111,11 +111,8 @@ async def get_label(input_model: GetLabelInput) -> GitLabLabel:
         )
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.get_async(endpoint)
-
-        # Parse the response into our schema
-        return GitLabLabel.model_validate(response)
+        # Make the API call, validating the response into our schema
+        return await gitlab_rest_client.get_model_async(endpoint, GitLabLabel)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             context = {"label_id": input_model.label_id}
@@ -174,11 +171,8 @@ async def create_label(input_model: CreateLabelInput) -> GitLabLabel:
         data["priority"] = input_model.priority
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.post_async(endpoint, json_data=data)
-
-        # Parse the response into our schema
-        return GitLabLabel.model_validate(response)
+        # Make the API call and parse the response into our schema
+        return await gitlab_rest_client.post_model_async(endpoint, GitLabLabel, json_data=data)
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
     except Exception as exc:
@@ -245,8 +239,7 @@ async def update_label(input_model: UpdateLabelInput) -> GitLabLabel:
     data = _build_update_data(input_model)
 
     try:
-        response = await gitlab_rest_client.put_async(endpoint, json_data=data)
-        return GitLabLabel.model_validate(response)
+        return await gitlab_rest_client.put_model_async(endpoint, GitLabLabel, json_data=data)
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
     except Exception as exc:
@@ -317,11 +310,8 @@ async def subscribe_to_label(input_model: SubscribeToLabelInput) -> GitLabLabel:
     endpoint = f"/projects/{project_path}/labels/{label_id}/subscribe"
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.post_async(endpoint, json_data={})
-
-        # Parse the response into our schema
-        return GitLabLabel.model_validate(response)
+        # Make the API call and parse the response into our schema
+        return await gitlab_rest_client.post_model_async(endpoint, GitLabLabel, json_data={})
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
     except Exception as exc:
@@ -354,11 +344,8 @@ async def unsubscribe_from_label(input_model: UnsubscribeFromLabelInput) -> GitL
     endpoint = f"/projects/{project_path}/labels/{label_id}/unsubscribe"
 
     try:
-        # Make the API call
-        response = await gitlab_rest_client.post_async(endpoint, json_data={})
-
-        # Parse the response into our schema
-        return GitLabLabel.model_validate(response)
+        # Make the API call and parse the response into our schema
+        return await gitlab_rest_client.post_model_async(endpoint, GitLabLabel, json_data={})
     except GitLabAPIError:
         raise  # Re-raise GitLabAPIError as is
     except Exception as exc:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
-from src.schemas.base import PaginatedResponse
+from src.schemas.base import PaginatedResponse, list_adapter
 from src.schemas.merge_requests import (
     AcceptedMergeRequest,
     CreateMergeRequestInput,
@@ -49,11 +49,11 @@ async def create_merge_request(
 
         payload = input_model.model_dump(exclude={"project_path"}, exclude_none=True)
 
-        response = await gitlab_rest_client.post_async(
-            f"/projects/{project_path}/merge_requests", json_data=payload
+        return await gitlab_rest_client.post_model_async(
+            f"/projects/{project_path}/merge_requests",
+            GitLabMergeRequest,
+            json_data=payload,
         )
-
-        return GitLabMergeRequest.model_validate(response)
     except GitLabAPIError as exc:
         raise GitLabAPIError(
             GitLabErrorType.REQUEST_FAILED,
@@ -97,25 +97,17 @@ async def list_merge_requests(
             exclude_none=True,
         )
 
-        # Convert state enum to string if present
-        if "state" in params and params["state"] is not None:
-            params["state"] = params["state"].value
-
-        # Convert labels list to comma-separated string if present
-        if "labels" in params and params["labels"] is not None:
-            params["labels"] = ",".join(params["labels"])
-
-        response = await gitlab_rest_client.get_async(
+        items = await gitlab_rest_client.get_validated_async(
             f"/projects/{project_path}/merge_requests",
+            list_adapter(GitLabMergeRequest),
             params=params,
         )
 
         # Try to get pagination count from headers if available (simulate for now)
         # In a real implementation, headers would be available from the HTTP client
-        count = len(response)
-        items = [GitLabMergeRequest.model_validate(mr) for mr in response]
-
-        return PaginatedResponse[GitLabMergeRequest](count=count, items=items)
+        return PaginatedResponse[GitLabMergeRequest].model_construct(
+            count=len(items), items=items
+        )
     except GitLabAPIError as exc:
         raise GitLabAPIError(
             GitLabErrorType.REQUEST_FAILED,
@@ -165,12 +157,11 @@ async def get_merge_request(
             "render_html": render_html,
         }
 
-        response = await gitlab_rest_client.get_async(
+        return await gitlab_rest_client.get_model_async(
             f"/projects/{project_path_encoded}/merge_requests/{mr_iid}",
+            GitLabMergeRequest,
             params=params,
         )
-
-        return GitLabMergeRequest.model_validate(response)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
@@ -218,15 +209,12 @@ async def update_merge_request(
             exclude={"project_path", "mr_iid"},
             exclude_none=True,
         )
-        for key in ("labels", "add_labels", "remove_labels"):
-            if key in payload and payload[key] is not None:
-                payload[key] = ",".join(payload[key])
 
-        response = await gitlab_rest_client.put_async(
+        return await gitlab_rest_client.put_model_async(
             f"/projects/{project_path_encoded}/merge_requests/{mr_iid}",
+            GitLabMergeRequest,
             json_data=payload,
         )
-        return GitLabMergeRequest.model_validate(response)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
@@ -306,11 +294,10 @@ async def merge_request_changes(project_path: str, mr_iid: int) -> MergeRequestC
     try:
         project_path_encoded = gitlab_rest_client._encode_path_parameter(project_path)
 
-        response = await gitlab_rest_client.get_async(
-            f"/projects/{project_path_encoded}/merge_requests/{mr_iid}/changes"
+        return await gitlab_rest_client.get_model_async(
+            f"/projects/{project_path_encoded}/merge_requests/{mr_iid}/changes",
+            MergeRequestChanges,
         )
-
-        return MergeRequestChanges.model_validate(response)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
@@ -368,12 +355,11 @@ async def merge_merge_request(
         # Remove None values
         payload = {k: v for k, v in payload.items() if v is not None}
 
-        response = await gitlab_rest_client.put_async(
+        return await gitlab_rest_client.put_model_async(
             f"/projects/{project_path_encoded}/merge_requests/{mr_iid}/merge",
+            AcceptedMergeRequest,
             json_data=payload,
         )
-
-        return AcceptedMergeRequest.model_validate(response)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
@@ -427,12 +413,11 @@ async def create_merge_request_comment(
     try:
         project_path_encoded = gitlab_rest_client._encode_path_parameter(project_path)
 
-        response = await gitlab_rest_client.post_async(
+        return await gitlab_rest_client.post_model_async(
             f"/projects/{project_path_encoded}/merge_requests/{mr_iid}/notes",
+            GitLabComment,
             json_data={"body": body},
         )
-
-        return GitLabComment.model_validate(response)
     except GitLabAPIError as exc:
         if "not found" in str(exc).lower():
             raise GitLabAPIError(
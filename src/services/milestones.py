@@ -3,6 +3,7 @@
 from typing import Any
 
 from ..api.rest_client import GitLabRestClient
+from ..schemas.base import list_adapter
 from ..schemas.milestones import (
     CreateMilestoneInput,
     DeleteMilestoneInput,
@@ -70,10 +71,11 @@ class GitLabMilestoneService:
         else:
             endpoint = f"/groups/{input_data.group_id}/milestones"
 
-        response = await self.client.get_async(endpoint, params=params)
-        milestones = [GitLabMilestone(**milestone) for milestone in response]
+        milestones = await self.client.get_validated_async(
+            endpoint, list_adapter(GitLabMilestone), params=params
+        )
 
-        return MilestoneListResponse(
+        return MilestoneListResponse.model_construct(
             milestones=milestones,
             count=len(milestones)
         )
@@ -91,8 +93,7 @@ class GitLabMilestoneService:
         else:
             endpoint = f"/groups/{input_data.group_id}/milestones/{input_data.milestone_id}"
 
-        response = await self.client.get_async(endpoint)
-        return GitLabMilestone(**response)
+        return await self.client.get_model_async(endpoint, GitLabMilestone)
 
     async def update_milestone(self, input_data: UpdateMilestoneInput) -> GitLabMilestone:
         """Update an existing milestone."""
@@ -31,7 +31,7 @@ async def create_repository(input_model: CreateRepositoryInput) -> dict[str, Any
         payload = {
             "name": input_model.name,
             "description": input_model.description,
-            "visibility": input_model.visibility.value,
+            "visibility": input_model.visibility,
             "initialize_with_readme": input_model.initialize_with_readme,
         }
         if input_model.namespace_id:
@@ -208,7 +208,7 @@ async def update_repository(input_model: UpdateRepositoryInput) -> dict[str, Any
         if input_model.description is not None:
             payload["description"] = input_model.description
         if input_model.visibility:
-            payload["visibility"] = input_model.visibility.value
+            payload["visibility"] = input_model.visibility
         if input_model.default_branch:
             payload["default_branch"] = input_model.default_branch
 
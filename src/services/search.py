@@ -3,9 +3,12 @@
 This module provides functions for searching across GitLab resources.
 """
 
+import logging
 import urllib.parse
 from typing import Any
 
+from pydantic import BaseModel
+
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.api.rest_client import gitlab_rest_client
 from src.schemas.search import (
@@ -22,22 +25,26 @@ from src.schemas.search import (
     SearchScope,
 )
 
+logger = logging.getLogger(__name__)
+
+# Result model per search scope, built once at import
+_RESULT_MODELS: dict[SearchScope, type[BaseModel]] = {
+    SearchScope.PROJECTS: ProjectSearchResult,
+    SearchScope.BLOBS: BlobSearchResult,
+    SearchScope.WIKI_BLOBS: BlobSearchResult,
+    SearchScope.ISSUES: IssueSearchResult,
+    SearchScope.MERGE_REQUESTS: MergeRequestSearchResult,
+    SearchScope.COMMITS: CommitSearchResult,
+    SearchScope.MILESTONES: MilestoneSearchResult,
+    SearchScope.NOTES: NoteSearchResult,
+}
+
 
 def _parse_search_results(
     response: list[dict[str, Any]], scope: SearchScope
 ) -> list[Any]:
     """Parse search results for all supported scopes, returning structured objects."""
-    result_map = {
-        SearchScope.PROJECTS: ProjectSearchResult,
-        SearchScope.BLOBS: BlobSearchResult,
-        SearchScope.WIKI_BLOBS: BlobSearchResult,
-        SearchScope.ISSUES: IssueSearchResult,
-        SearchScope.MERGE_REQUESTS: MergeRequestSearchResult,
-        SearchScope.COMMITS: CommitSearchResult,
-        SearchScope.MILESTONES: MilestoneSearchResult,
-        SearchScope.NOTES: NoteSearchResult,
-    }
-    model_class = result_map.get(scope)
+    model_class = _RESULT_MODELS.get(scope)
     if model_class is None:
         raise UnsupportedSearchScopeError(scope)
 
@@ -48,8 +55,9 @@ def _parse_search_results(
             # Let Pydantic handle field validation and filtering
             results.append(model_class.model_validate(item))
         except Exception as e:
-            # Log the error but continue processing other items
-            print(f"Warning: Failed to parse search result item: {e}")
+            # Log the error but continue processing other items; stdout carries
+            # the MCP protocol, so nothing may be printed there
+            logger.warning(f"Failed to parse search result item: {e}")
             continue
 
     return results
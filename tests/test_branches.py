@@ -123,7 +123,7 @@ class TestBranchBasicOperations:
         page1_branches = await list_branches(list_input)
 
         # Test second page
-        list_input.page = 2
+        list_input = list_input.model_copy(update={"page": 2})
         page2_branches = await list_branches(list_input)
 
         # Validate pagination
@@ -103,7 +103,7 @@ class TestRepositoryBasicOperations:
         page1_repos = await list_repositories(list_input)
 
         # Test second page if enough repositories exist
-        list_input.page = 2
+        list_input = list_input.model_copy(update={"page": 2})
         page2_repos = await list_repositories(list_input)
 
         # Validate pagination
@@ -0,0 +1,26 @@
+"""Shared fixtures for unit tests (no API calls)."""
+
+import httpx
+import pytest
+
+from src.api.rest_client import GitLabRestClient
+
+
+@pytest.fixture
+def make_rest_client():
+    """Build REST clients whose requests are answered by an in-process handler.
+
+    The handler receives each httpx.Request and returns an httpx.Response; it
+    may be sync or async.
+    """
+
+    def build(handler) -> GitLabRestClient:
+        client = GitLabRestClient()
+        client._token = "test-token"
+        client._httpx_client = httpx.AsyncClient(
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return build
@@ -0,0 +1,49 @@
+"""Unit tests for commit schemas."""
+
+from datetime import UTC, datetime
+
+from src.schemas.branches import GitLabReference
+from src.schemas.commits import CommitStats, GitLabCommitDetail
+
+COMMIT = {
+    "id": "a1b2c3d4e5f6789012345678901234567890abcd",
+    "short_id": "a1b2c3d4",
+    "title": "Fix login",
+    "message": "Fix login\n\nResolves OAuth issue",
+    "created_at": "2024-01-15T10:30:00.000Z",
+}
+
+
+class TestGitLabCommitDetail:
+    """Unit tests for GitLabCommitDetail parsing."""
+
+    def test_stats_are_optional(self):
+        """Test that commits without statistics parse with stats unset."""
+        assert GitLabCommitDetail.model_validate(COMMIT).stats is None
+
+    def test_stats_are_parsed_into_model(self):
+        """Test that commit statistics become a typed model."""
+        commit = GitLabCommitDetail.model_validate(
+            {**COMMIT, "stats": {"additions": 3, "deletions": 1, "total": 4}}
+        )
+
+        assert commit.stats == CommitStats(additions=3, deletions=1, total=4)
+
+    def test_branch_commit_ignores_unknown_fields(self):
+        """Test that extra commit fields returned by GitLab are dropped."""
+        branch = GitLabReference.model_validate(
+            {"name": "main", "commit": {**COMMIT, "parent_ids": ["abc"]}}
+        )
+
+        assert branch.commit.short_id == "a1b2c3d4"
+        assert "parent_ids" not in branch.commit.model_dump()
+
+    def test_dates_stay_strings_until_requested(self):
+        """Test that commit dates are kept raw and parsed only on access."""
+        commit = GitLabCommitDetail.model_validate(
+            {**COMMIT, "authored_date": "2024-01-15T10:30:00.000+02:00"}
+        )
+
+        assert commit.model_dump()["authored_date"] == "2024-01-15T10:30:00.000+02:00"
+        assert commit.authored_at == datetime(2024, 1, 15, 8, 30, tzinfo=UTC)
+        assert commit.committed_at is None
@@ -0,0 +1,84 @@
+"""Unit tests for GitLab API exception types."""
+
+from src.api.custom_exceptions import GitLabAPIError, GitLabAuthError, GitLabErrorType
+
+
+class TestGitLabAPIErrorMessage:
+    """Unit tests for GitLabAPIError message formatting."""
+
+    def test_str_includes_details(self):
+        """Test that details are appended to the standard message."""
+        error = GitLabAPIError(GitLabErrorType.NOT_FOUND, {"message": "404 Not Found"})
+
+        assert str(error) == "Resource not found: {'message': '404 Not Found'}"
+
+    def test_str_without_details(self):
+        """Test that errors without details use the standard message only."""
+        assert str(GitLabAPIError(GitLabErrorType.ACCESS_DENIED)) == "Access denied"
+
+    def test_details_are_formatted_on_demand(self):
+        """Test that the message reflects details at the time it is rendered."""
+        error = GitLabAPIError(GitLabErrorType.REQUEST_FAILED, {"message": "a"})
+        error.details["message"] = "b"
+
+        assert error.args == ("Request failed",)
+        assert str(error) == "Request failed: {'message': 'b'}"
+
+
+class TestForOperation:
+    """Unit tests for GitLabAPIError.for_operation."""
+
+    def test_builds_operation_details(self):
+        """Test that message and operation end up in the error details."""
+        error = GitLabAPIError.for_operation(
+            GitLabErrorType.SERVER_ERROR, "create_branch", "Internal error"
+        )
+
+        assert error.error_type == GitLabErrorType.SERVER_ERROR
+        assert error.details == {
+            "message": "Internal error",
+            "operation": "create_branch",
+        }
+        assert error.code is None
+
+    def test_keeps_status_code_of_gitlab_cause(self):
+        """Test that wrapping a GitLab error preserves its HTTP status code."""
+        cause = GitLabAPIError(GitLabErrorType.NOT_FOUND, {"message": "404"}, code=404)
+
+        error = GitLabAPIError.for_operation(
+            GitLabErrorType.REQUEST_FAILED, "get_branch", "Failed to get branch", cause
+        )
+
+        assert error.code == 404
+
+    def test_ignores_causes_without_status_code(self):
+        """Test that arbitrary exceptions do not contribute a status code."""
+        error = GitLabAPIError.for_operation(
+            GitLabErrorType.SERVER_ERROR, "get_branch", "Internal error", KeyError("x")
+        )
+
+        assert error.code is None
+
+    def test_ignores_code_attributes_of_foreign_exceptions(self):
+        """Test that only GitLab errors contribute their status code."""
+        cause = OSError(5, "I/O error")
+        cause.code = 5
+
+        error = GitLabAPIError.for_operation(
+            GitLabErrorType.SERVER_ERROR, "get_file", "Internal error", cause
+        )
+
+        assert error.code is None
+
+
+class TestGitLabAuthError:
+    """Unit tests for GitLabAuthError."""
+
+    def test_is_invalid_token_error(self):
+        """Test that the auth error carries the invalid token type and 401."""
+        error = GitLabAuthError()
+
+        assert isinstance(error, GitLabAPIError)
+        assert error.error_type == GitLabErrorType.INVALID_TOKEN
+        assert error.code == 401
+        assert "GITLAB_PERSONAL_ACCESS_TOKEN" in str(error)
@@ -0,0 +1,125 @@
+"""Unit tests for the files service using a mock transport (no API calls)."""
+
+import base64
+from unittest.mock import patch
+
+import httpx
+import pydantic
+import pytest
+
+from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
+from src.schemas.files import CreateFileInput, GetFileContentsInput, GitLabContent
+from src.services import files as files_service
+from src.services.files import get_file_contents
+
+FILE_RESPONSE = {
+    "file_name": "README.md",
+    "file_path": "docs/README.md",
+    "size": 5,
+    "encoding": "base64",
+    "content": base64.b64encode(b"hello").decode(),
+    "content_sha256": "2cf24dba",
+    "ref": "main",
+    "blob_id": "b10b",
+    "commit_id": "c0ff",
+    "last_commit_id": "1a57",
+    "execute_filemode": False,
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_decoded_contents():
+    """Start every test with an empty decoded-content cache."""
+    files_service._decoded_contents.clear()
+    yield
+    files_service._decoded_contents.clear()
+
+
+@pytest.fixture
+def respond(make_rest_client):
+    """Route the shared REST client to a handler for the duration of a test."""
+    patchers = []
+
+    def install(handler):
+        client = make_rest_client(handler)
+        patcher = patch("src.services.files.gitlab_rest_client", client)
+        patcher.start()
+        patchers.append(patcher)
+        return client
+
+    yield install
+    for patcher in patchers:
+        patcher.stop()
+
+
+class TestGetFileContents:
+    """Unit tests for get_file_contents function."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_file_content(self, respond):
+        """Test that the response is validated and its content base64-decoded."""
+        respond(lambda request: httpx.Response(200, json=FILE_RESPONSE))
+
+        result = await get_file_contents(
+            GetFileContentsInput(project_path="group/project", file_path="docs/README.md")
+        )
+
+        assert isinstance(result, GitLabContent)
+        assert result.content == "hello"
+        assert result.ref == "main"
+        assert result.blob_id == "b10b"
+        assert result.size == 5
+
+    @pytest.mark.asyncio
+    async def test_same_blob_is_decoded_once(self, respond):
+        """Test that repeated fetches of one blob reuse the decoded content."""
+        respond(lambda request: httpx.Response(200, json=FILE_RESPONSE))
+        input_model = GetFileContentsInput(project_path="group/project", file_path="docs/README.md")
+
+        with patch("src.services.files.base64.b64decode", wraps=base64.b64decode) as b64decode:
+            first = await get_file_contents(input_model)
+            second = await get_file_contents(input_model.model_copy(update={"ref": "develop"}))
+
+        assert b64decode.call_count == 1
+        assert second.content is first.content
+        assert second.ref == "develop"
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, respond):
+        """Test that a missing file is reported as NOT_FOUND."""
+        respond(lambda request: httpx.Response(404, json={"message": "404 File Not Found"}))
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await get_file_contents(
+                GetFileContentsInput(project_path="group/project", file_path="missing.md")
+            )
+
+        assert exc_info.value.error_type == GitLabErrorType.NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_is_server_error(self, respond):
+        """Test that a response missing required fields is a server error."""
+        respond(lambda request: httpx.Response(200, json={"size": 5}))
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await get_file_contents(
+                GetFileContentsInput(project_path="group/project", file_path="docs/README.md")
+            )
+
+        assert exc_info.value.error_type == GitLabErrorType.SERVER_ERROR
+
+
+class TestFileEncoding:
+    """Unit tests for file encoding validation."""
+
+    def test_rejects_unknown_encoding(self):
+        """Test that only encodings supported by GitLab are accepted."""
+        with pytest.raises(pydantic.ValidationError):
+            CreateFileInput(
+                project_path="group/project",
+                file_path="a.txt",
+                branch="main",
+                content="x",
+                commit_message="Add a.txt",
+                encoding="utf-16",
+            )
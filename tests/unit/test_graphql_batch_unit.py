@@ -0,0 +1,76 @@
+"""Unit tests for merging GraphQL queries into batched operations."""
+
+from graphql import parse, print_ast
+
+from src.api.graphql_batch import get_batchable_operation, merge_queries
+
+
+class TestGetBatchableOperation:
+    """Unit tests for get_batchable_operation."""
+
+    def test_accepts_plain_query(self):
+        """Test that a query selecting top-level fields can be batched."""
+        document = parse("query Q($id: ID!) { workItem(id: $id) { id } }")
+
+        assert get_batchable_operation(document) is document.definitions[0]
+
+    def test_rejects_mutations(self):
+        """Test that mutations are never merged."""
+        document = parse("mutation { workItemDelete(input: {}) { errors } }")
+
+        assert get_batchable_operation(document) is None
+
+    def test_rejects_fragment_definitions(self):
+        """Test that documents with named fragments are left alone."""
+        document = parse("query { currentUser { ...U } } fragment U on User { id }")
+
+        assert get_batchable_operation(document) is None
+
+    def test_rejects_top_level_inline_fragments(self):
+        """Test that non-field top-level selections are left alone."""
+        document = parse("query { ... on Query { currentUser { id } } }")
+
+        assert get_batchable_operation(document) is None
+
+
+class TestMergeQueries:
+    """Unit tests for merge_queries."""
+
+    def _operation(self, query):
+        return get_batchable_operation(parse(query))
+
+    def test_prefixes_variables_and_aliases_fields(self):
+        """Test that each query gets its own variable and alias namespace."""
+        merged = merge_queries([
+            (self._operation("query A($id: ID!) { workItem(id: $id) { id } }"), {"id": "1"}),
+            (self._operation("query B($id: ID!) { item: workItem(id: $id) { title } }"), {"id": "2"}),
+        ])
+
+        printed = print_ast(merged.document)
+        assert "query Batch($b0_id: ID!, $b1_id: ID!)" in printed
+        assert "b0_workItem: workItem(id: $b0_id)" in printed
+        assert "b1_item: workItem(id: $b1_id)" in printed
+        assert merged.variables == {"b0_id": "1", "b1_id": "2"}
+
+    def test_split_restores_original_response_keys(self):
+        """Test that batched data is split back into per-query results."""
+        merged = merge_queries([
+            (self._operation("{ currentUser { id } }"), None),
+            (self._operation("{ me: currentUser { name } }"), None),
+        ])
+
+        results = merged.split({
+            "b0_currentUser": {"id": "1"},
+            "b1_me": {"name": "Test"},
+        })
+
+        assert results == [{"currentUser": {"id": "1"}}, {"me": {"name": "Test"}}]
+
+    def test_split_omits_skipped_fields(self):
+        """Test that fields excluded by directives stay absent from results."""
+        merged = merge_queries([
+            (self._operation("query($x: Boolean!) { a: currentUser @include(if: $x) { id } }"), {"x": False}),
+            (self._operation("{ currentUser { id } }"), None),
+        ])
+
+        assert merged.split({"b1_currentUser": {"id": "1"}})[0] == {}
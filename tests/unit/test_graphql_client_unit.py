@@ -0,0 +1,528 @@
+"""Unit tests for the GitLab GraphQL client using a mock transport (no API calls)."""
+
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.api.custom_exceptions import GitLabAPIError, GitLabAuthError, GitLabErrorType
+from src.api.graphql_client import (
+    MAX_CACHED_QUERY_LENGTH,
+    MAX_QUERY_LOG_LENGTH,
+    GitLabGraphQLClient,
+    GitLabGraphQLClientSingleton,
+    _build_request,
+    _classify_error,
+    _shared_pool,
+    close_shared_pool,
+    get_graphql_client,
+    initialize_graphql_client,
+)
+
+
+@contextmanager
+def mock_endpoint(handler):
+    """Route the shared GraphQL connection pool to an in-process handler."""
+
+    def create_pool():
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    _shared_pool.clients.clear()
+    with patch("src.api.graphql_client._create_pool", create_pool):
+        yield
+    _shared_pool.clients.clear()
+
+
+class TestQueryParsing:
+    """Unit tests for cached query parsing."""
+
+    def test_reuses_parsed_document(self):
+        """Test that the same query string is parsed only once."""
+        query = "query Cached($id: ID!) { workItem(id: $id) { id } }"
+
+        first = _build_request(query, {"id": "1"})
+        second = _build_request(query, {"id": "2"})
+
+        assert first.document is second.document
+        assert first.variable_values == {"id": "1"}
+        assert second.variable_values == {"id": "2"}
+
+    def test_oversized_queries_are_not_cached(self):
+        """Test that very large queries bypass the parse cache."""
+        padding = " " * MAX_CACHED_QUERY_LENGTH
+        query = f"query {{ currentUser {{ id }} }}{padding}"
+
+        assert _build_request(query, None).document is not _build_request(query, None).document
+
+
+class TestDefaultClient:
+    """Unit tests for the process-wide default client."""
+
+    @pytest.fixture(autouse=True)
+    async def reset_default_client(self):
+        """Restore an environment-configured default client after each test."""
+        yield
+        await GitLabGraphQLClientSingleton.close_singleton()
+        initialize_graphql_client()
+        await GitLabGraphQLClientSingleton.close_singleton()
+
+    def test_returns_same_instance(self):
+        """Test that repeated lookups return one shared client."""
+        assert get_graphql_client() is get_graphql_client()
+        assert GitLabGraphQLClientSingleton.get_instance() is get_graphql_client()
+
+    def test_initialize_replaces_instance(self):
+        """Test that explicit initialization swaps in a configured client."""
+        previous = get_graphql_client()
+
+        client = initialize_graphql_client("https://gitlab.example.com/", "test-token")
+
+        assert client is not previous
+        assert get_graphql_client() is client
+        assert client.graphql_url == "https://gitlab.example.com/api/graphql"
+        assert client.token == "test-token"
+
+    @pytest.mark.asyncio
+    async def test_initialize_closes_replaced_client(self):
+        """Test that re-initialising closes the session of the client it replaces."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"data": {"currentUser": {"id": "1"}}})
+
+        with mock_endpoint(handler):
+            previous = initialize_graphql_client("https://gitlab.example.com", "test-token")
+            await previous.execute("query { currentUser { id } }")
+            transport = previous._connection().transport
+
+            initialize_graphql_client("https://gitlab.example.com", "other-token")
+            await asyncio.sleep(0)  # let the scheduled close start
+            await asyncio.gather(*previous._close_tasks)
+
+        assert previous._connection() is None
+        assert transport.client is None
+
+    @pytest.mark.asyncio
+    async def test_close_singleton_drops_instance(self):
+        """Test that closing the singleton makes the next lookup build a new client."""
+        previous = get_graphql_client()
+
+        await GitLabGraphQLClientSingleton.close_singleton()
+
+        assert get_graphql_client() is not previous
+
+    def test_initialize_rereads_environment(self, monkeypatch):
+        """Test that initialization picks up environment changes."""
+        monkeypatch.setenv("GITLAB_API_URL", "https://first.example.com/")
+        initialize_graphql_client()
+        monkeypatch.setenv("GITLAB_API_URL", "https://second.example.com/")
+
+        assert GitLabGraphQLClient().base_url == "https://first.example.com"
+        assert initialize_graphql_client().base_url == "https://second.example.com"
+
+
+class TestClientConstruction:
+    """Unit tests for GitLabGraphQLClient construction."""
+
+    def test_explicit_base_url_is_normalized(self):
+        """Test that a trailing slash is stripped from an explicit base URL."""
+        client = GitLabGraphQLClient("https://gitlab.example.com/", "test-token")
+
+        assert client.graphql_url == "https://gitlab.example.com/api/graphql"
+
+    def test_auth_header_is_built_once(self):
+        """Test that the Authorization header is prepared at construction."""
+        client = GitLabGraphQLClient("https://gitlab.example.com", "test-token")
+
+        connection = client._new_connection()
+
+        assert client._auth_header == {"Authorization": "Bearer test-token"}
+        assert connection.transport.headers is client._auth_header
+
+
+class TestPersistentSession:
+    """Unit tests for reusing one GraphQL session across calls."""
+
+    @pytest.fixture
+    def requests(self):
+        """Requests received by the fake GraphQL endpoint."""
+        return []
+
+    @pytest.fixture
+    def graphql_client(self, requests):
+        """GraphQL client whose HTTPX transport answers from a handler."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, json={"data": {"currentUser": {"id": "1"}}})
+
+        with mock_endpoint(handler):
+            yield GitLabGraphQLClient("https://gitlab.example.com", "test-token")
+
+    @pytest.mark.asyncio
+    async def test_reuses_connection_pool_across_calls(self, graphql_client, requests):
+        """Test that consecutive queries share one HTTPX client."""
+        first = await graphql_client.execute("query { currentUser { id } }")
+        pool = graphql_client._connection().transport.client
+        second = await graphql_client.execute("query { currentUser { id } }")
+
+        assert first == second == {"currentUser": {"id": "1"}}
+        assert len(requests) == 2
+        assert pool is not None
+        assert graphql_client._connection().transport.client is pool
+
+        await graphql_client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_session(self, graphql_client):
+        """Test that close() disconnects and the next call reconnects."""
+        await graphql_client.execute("query { currentUser { id } }")
+        await graphql_client.close()
+
+        assert graphql_client._connection() is None
+
+        await graphql_client.execute("query { currentUser { id } }")
+        assert graphql_client._connection().session is not None
+
+        await graphql_client.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool(self):
+        """Test that clients with different tokens share the pool but not headers."""
+        tokens = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            tokens.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"data": {"currentUser": {"id": "1"}}})
+
+        with mock_endpoint(handler):
+            first = GitLabGraphQLClient("https://gitlab.example.com", "first-token")
+            second = GitLabGraphQLClient("https://gitlab.example.com", "second-token")
+            await first.execute("query { currentUser { id } }")
+            await second.execute("query { currentUser { id } }")
+
+            assert first._connection().transport.client is second._connection().transport.client
+            assert tokens == ["Bearer first-token", "Bearer second-token"]
+
+            await first.close()
+            await second.close()
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_pool_open(self, graphql_client):
+        """Test that closing one client leaves the shared pool usable."""
+        await graphql_client.execute("query { currentUser { id } }")
+        pool = graphql_client._connection().transport.client
+        await graphql_client.close()
+
+        assert not pool.is_closed
+
+        await close_shared_pool()
+        assert pool.is_closed
+
+    def test_event_loops_keep_separate_sessions(self, graphql_client):
+        """Test that a second event loop neither reuses nor closes the first's session."""
+        query = "query { currentUser { id } }"
+        main_loop = asyncio.new_event_loop()
+        try:
+            main_loop.run_until_complete(graphql_client.execute(query))
+            main_session = main_loop.run_until_complete(graphql_client._ensure_session())
+
+            def use_and_close_on_other_loop():
+                async def run():
+                    await graphql_client.execute(query)
+                    assert await graphql_client._ensure_session() is not main_session
+                    await graphql_client.close()
+
+                asyncio.run(run())
+
+            thread = threading.Thread(target=use_and_close_on_other_loop)
+            thread.start()
+            thread.join()
+
+            assert main_loop.run_until_complete(graphql_client._ensure_session()) is main_session
+            assert main_loop.run_until_complete(graphql_client.execute(query))
+            main_loop.run_until_complete(graphql_client.close())
+        finally:
+            main_loop.close()
+
+    def test_other_loop_leaves_pool_open(self, graphql_client):
+        """Test that closing the pool on another loop does not drop this loop's pool."""
+
+        async def connect():
+            await graphql_client.execute("query { currentUser { id } }")
+            return _shared_pool.get()
+
+        main_loop = asyncio.new_event_loop()
+        try:
+            pool = main_loop.run_until_complete(connect())
+
+            thread = threading.Thread(target=asyncio.run, args=(close_shared_pool(),))
+            thread.start()
+            thread.join()
+
+            assert not pool.is_closed
+            assert _shared_pool.clients.get(main_loop) is pool
+
+            main_loop.run_until_complete(graphql_client.close())
+            main_loop.run_until_complete(close_shared_pool())
+            assert pool.is_closed
+        finally:
+            main_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_close_without_connecting_is_safe(self):
+        """Test that closing a never-used client does not fail."""
+        client = GitLabGraphQLClient("https://gitlab.example.com", "test-token")
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self, graphql_client):
+        """Test that closing twice is safe and drops the transport."""
+        await graphql_client.execute("query { currentUser { id } }")
+
+        await graphql_client.close()
+        await graphql_client.close()
+
+        assert graphql_client._connection() is None
+
+    @pytest.mark.asyncio
+    async def test_close_resets_state_when_disconnect_fails(self, graphql_client):
+        """Test that a failing disconnect still leaves the client reusable."""
+        await graphql_client.execute("query { currentUser { id } }")
+
+        with (
+            patch.object(
+                graphql_client._connection().client, "close_async", side_effect=RuntimeError
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await graphql_client.close()
+
+        assert graphql_client._connection() is None
+        assert await graphql_client.execute("query { currentUser { id } }")
+
+
+class TestErrorClassification:
+    """Unit tests for mapping GraphQL failures to GitLabAPIError types."""
+
+    @pytest.fixture
+    def respond(self):
+        """Build a GraphQL client whose endpoint answers with the given handler."""
+        endpoints = []
+
+        def factory(handler):
+            endpoint = mock_endpoint(handler)
+            endpoint.__enter__()
+            endpoints.append(endpoint)
+            return GitLabGraphQLClient("https://gitlab.example.com", "test-token")
+
+        yield factory
+        for endpoint in endpoints:
+            endpoint.__exit__(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_graphql_errors_are_request_failures(self, respond):
+        """Test that errors in the GraphQL response become REQUEST_FAILED."""
+        client = respond(
+            lambda request: httpx.Response(
+                200, json={"errors": [{"message": "Field 'nope' doesn't exist"}]}
+            )
+        )
+        query = "query { currentUser { id } }" + " " * MAX_QUERY_LOG_LENGTH
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await client.execute(query, {"a": 1})
+
+        assert exc_info.value.error_type == GitLabErrorType.REQUEST_FAILED
+        assert exc_info.value.details["query"].endswith("...")
+        assert exc_info.value.details["variables"] == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_syntax_errors_are_request_failures(self, respond):
+        """Test that unparsable queries become REQUEST_FAILED."""
+        client = respond(lambda request: httpx.Response(200, json={"data": {}}))
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await client.execute("query {")
+
+        assert exc_info.value.error_type == GitLabErrorType.REQUEST_FAILED
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_is_invalid_token(self, respond):
+        """Test that HTTP 401 from the GraphQL endpoint becomes INVALID_TOKEN."""
+        client = respond(lambda request: httpx.Response(401, text="Unauthorized"))
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await client.execute("query { currentUser { id } }")
+
+        assert exc_info.value.error_type == GitLabErrorType.INVALID_TOKEN
+        assert exc_info.value.code == 401
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_request_failures(self, respond):
+        """Test that transport timeouts become REQUEST_FAILED."""
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = respond(handler)
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await client.execute("query { currentUser { id } }")
+
+        assert exc_info.value.error_type == GitLabErrorType.REQUEST_FAILED
+        assert exc_info.value.details["message"] == "GraphQL request timed out"
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_server_errors(self, respond):
+        """Test that HTTP 5xx responses become SERVER_ERROR."""
+        client = respond(lambda request: httpx.Response(502, text="Bad Gateway"))
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await client.execute("query { currentUser { id } }")
+
+        assert exc_info.value.error_type == GitLabErrorType.SERVER_ERROR
+        assert exc_info.value.code == 502
+
+    @pytest.mark.asyncio
+    async def test_missing_token_is_auth_error(self):
+        """Test that a client without a token raises GitLabAuthError unchanged."""
+        client = GitLabGraphQLClient("https://gitlab.example.com", "test-token")
+        client.token = None
+
+        with pytest.raises(GitLabAuthError) as exc_info:
+            await client.execute("query { currentUser { id } }")
+
+        assert exc_info.value.error_type == GitLabErrorType.INVALID_TOKEN
+        assert client._connection() is None
+
+    def test_unmatched_errors_are_server_errors(self):
+        """Test that exceptions matching no rule fall back to SERVER_ERROR."""
+        error = _classify_error(RuntimeError("boom"), "query { x }", None)
+
+        assert error.error_type == GitLabErrorType.SERVER_ERROR
+        assert error.code is None
+        assert "boom" in error.details["message"]
+
+
+class TestQueryBatching:
+    """Unit tests for merging concurrent queries into one request."""
+
+    @pytest.fixture
+    def requests(self):
+        """Requests received by the fake GraphQL endpoint."""
+        return []
+
+    @pytest.fixture
+    def batching_client(self, requests):
+        """Batching GraphQL client backed by a fake endpoint."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payload = json.loads(request.content)
+            requests.append(payload)
+            if "broken" in payload["query"]:
+                return httpx.Response(200, json={"errors": [{"message": "broken"}]})
+            if "query Batch" in payload["query"]:
+                return httpx.Response(200, json={"data": {
+                    "b0_project": {"id": "1"},
+                    "b1_project": {"id": "2"},
+                }})
+            return httpx.Response(200, json={"data": {"project": {"id": "single"}}})
+
+        with mock_endpoint(handler):
+            yield GitLabGraphQLClient(
+                "https://gitlab.example.com", "test-token", batching=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_request(self, batching_client, requests):
+        """Test that queries issued together are sent as one operation."""
+        query = "query P($path: ID!) { project(fullPath: $path) { id } }"
+
+        first, second = await asyncio.gather(
+            batching_client.query(query, {"path": "a"}),
+            batching_client.query(query, {"path": "b"}),
+        )
+
+        assert len(requests) == 1
+        assert requests[0]["variables"] == {"b0_path": "a", "b1_path": "b"}
+        assert first == {"project": {"id": "1"}}
+        assert second == {"project": {"id": "2"}}
+
+        await batching_client.close()
+
+    @pytest.mark.asyncio
+    async def test_single_query_is_sent_unchanged(self, batching_client, requests):
+        """Test that a lone query is not rewritten."""
+        result = await batching_client.query(
+            "query P($path: ID!) { project(fullPath: $path) { id } }", {"path": "a"}
+        )
+
+        assert result == {"project": {"id": "single"}}
+        assert requests[0]["variables"] == {"path": "a"}
+
+        await batching_client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_individual_queries(
+        self, batching_client, requests
+    ):
+        """Test that one broken query does not fail the others."""
+        ok, broken = await asyncio.gather(
+            batching_client.query("{ project(fullPath: \"a\") { id } }"),
+            batching_client.query("{ broken: project(fullPath: \"b\") { id } }"),
+            return_exceptions=True,
+        )
+
+        assert len(requests) == 3
+        assert ok == {"project": {"id": "single"}}
+        assert isinstance(broken, GitLabAPIError)
+
+        await batching_client.close()
+
+    def test_event_loops_batch_separately(self, batching_client, requests):
+        """Test that a flush on one event loop leaves another loop's queries alone."""
+        query = "query P($path: ID!) { project(fullPath: $path) { id } }"
+        main_loop = asyncio.new_event_loop()
+        try:
+            main_task = main_loop.create_task(batching_client.query(query, {"path": "a"}))
+            # Run one iteration so the query is queued but its flush is not yet run
+            main_loop.call_soon(main_loop.stop)
+            main_loop.run_forever()
+            assert len(batching_client._pending[main_loop]) == 1
+
+            def query_on_other_loop():
+                async def run():
+                    assert await batching_client.query(query, {"path": "b"}) == {
+                        "project": {"id": "single"}
+                    }
+                    await batching_client.close()
+
+                asyncio.run(run())
+
+            thread = threading.Thread(target=query_on_other_loop)
+            thread.start()
+            thread.join()
+
+            assert len(requests) == 1
+            assert len(batching_client._pending[main_loop]) == 1
+            assert main_loop.run_until_complete(main_task) == {"project": {"id": "single"}}
+            assert len(requests) == 2
+            main_loop.run_until_complete(batching_client.close())
+        finally:
+            main_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_mutations_are_never_batched(self, batching_client, requests):
+        """Test that mutation() always sends its own request."""
+        await asyncio.gather(
+            batching_client.mutation("mutation { a: project(fullPath: \"a\") { id } }"),
+            batching_client.mutation("mutation { b: project(fullPath: \"b\") { id } }"),
+        )
+
+        assert len(requests) == 2
+
+        await batching_client.close()
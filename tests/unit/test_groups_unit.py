@@ -0,0 +1,255 @@
+"""Unit tests for the groups service using mocks (no API calls)."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pydantic
+import pytest
+
+from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
+from src.schemas.base import VISIBILITY_LEVELS
+from src.schemas.groups import (
+    CreateGroupInput,
+    GetGroupByProjectNamespaceInput,
+    GetGroupInput,
+    GitLabGroup,
+    GitLabGroupListResponse,
+    GroupAccessLevel,
+    ListGroupsInput,
+    UpdateGroupInput,
+)
+from src.schemas.labels import CreateLabelInput, GitLabLabel, GitLabLabelListResponse
+from src.services import groups as groups_service
+from src.services.groups import get_group, get_group_by_project_namespace, list_groups
+
+GROUP_RESPONSE = {
+    "id": 1,
+    "name": "Backend",
+    "path": "backend",
+    "visibility": "private",
+    "web_url": "https://gitlab.example.com/groups/backend",
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_group_cache():
+    """Start every test with an empty group cache."""
+    groups_service._group_cache.clear()
+    yield
+    groups_service._group_cache.clear()
+
+
+class TestListGroups:
+    """Unit tests for list_groups function."""
+
+    @pytest.fixture
+    def respond_with(self, make_rest_client):
+        """Serve a JSON payload to the groups service through a mock transport."""
+        patchers = []
+
+        def install(payload):
+            client = make_rest_client(lambda request: httpx.Response(200, json=payload))
+            patcher = patch("src.services.groups.gitlab_rest_client", client)
+            patcher.start()
+            patchers.append(patcher)
+
+        yield install
+        for patcher in patchers:
+            patcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_parses_groups(self, respond_with):
+        """Test that the group list is validated into group models."""
+        respond_with([GROUP_RESPONSE, {**GROUP_RESPONSE, "id": 2}])
+
+        response = await list_groups(ListGroupsInput())
+
+        assert isinstance(response, GitLabGroupListResponse)
+        assert response.count == 2
+        assert [group.id for group in response.items] == [1, 2]
+        assert all(isinstance(group, GitLabGroup) for group in response.items)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("level", [GroupAccessLevel.NO_ACCESS, GroupAccessLevel.DEVELOPER])
+    async def test_sends_min_access_level_as_int(self, level):
+        """Test that the access level is passed through as its integer value."""
+        with patch("src.services.groups.gitlab_rest_client") as mock:
+            mock.get_validated_async = AsyncMock(return_value=[])
+            await list_groups(ListGroupsInput(min_access_level=level))
+
+        params = mock.get_validated_async.call_args.kwargs["params"]
+        assert params["min_access_level"] == int(level)
+        assert type(params["min_access_level"]) is int
+
+    @pytest.mark.asyncio
+    async def test_invalid_group_is_server_error(self, respond_with):
+        """Test that malformed API data surfaces as a GitLabAPIError."""
+        respond_with([{"id": "not-a-number"}])
+
+        with pytest.raises(GitLabAPIError) as exc_info:
+            await list_groups(ListGroupsInput())
+
+        assert exc_info.value.error_type == GitLabErrorType.SERVER_ERROR
+
+
+class TestGetGroup:
+    """Unit tests for get_group function."""
+
+    @pytest.fixture
+    def mock_rest_client(self):
+        """Mock REST client returning a group."""
+        with patch("src.services.groups.gitlab_rest_client") as mock:
+            mock.get_model_async = AsyncMock(
+                return_value=GitLabGroup.model_validate(GROUP_RESPONSE)
+            )
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_returns_immutable_group(self, mock_rest_client):
+        """Test that the group is parsed into a frozen response model."""
+        group = await get_group(GetGroupInput(group_id="backend"))
+
+        assert group.labels is None
+        with pytest.raises(pydantic.ValidationError):
+            group.name = "Frontend"
+
+    @pytest.mark.asyncio
+    async def test_with_labels_returns_copy_with_labels(self, mock_rest_client):
+        """Test that requested labels are attached to the returned group."""
+        label = GitLabLabel(id=1, name="bug", color="#ff0000", text_color="#ffffff")
+        labels = GitLabLabelListResponse(items=[label])
+
+        with patch("src.services.groups.list_group_labels", AsyncMock(return_value=labels)):
+            group = await get_group(GetGroupInput(group_id="backend", with_labels=True))
+
+        assert isinstance(group, GitLabGroup)
+        assert group.labels == ["bug"]
+
+    @pytest.mark.asyncio
+    async def test_with_labels_missing_returns_empty_list(self, mock_rest_client):
+        """Test that a 404 from the labels endpoint yields an empty label list."""
+        not_found = GitLabAPIError(GitLabErrorType.NOT_FOUND, {"message": "404"}, code=404)
+
+        with patch("src.services.groups.list_group_labels", AsyncMock(side_effect=not_found)):
+            group = await get_group(GetGroupInput(group_id="backend", with_labels=True))
+
+        assert group.labels == []
+
+
+class TestGroupCache:
+    """Unit tests for short-lived caching of get_group results."""
+
+    @pytest.fixture
+    def mock_rest_client(self):
+        """Mock REST client returning a group."""
+        with patch("src.services.groups.gitlab_rest_client") as mock:
+            mock.get_model_async = AsyncMock(
+                return_value=GitLabGroup.model_validate(GROUP_RESPONSE)
+            )
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookup_is_served_from_cache(self, mock_rest_client):
+        """Test that a second lookup of the same group skips the API call."""
+        first = await get_group(GetGroupInput(group_id="backend"))
+        second = await get_group(GetGroupInput(group_id="backend"))
+
+        assert second is first
+        assert mock_rest_client.get_model_async.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, mock_rest_client, monkeypatch):
+        """Test that entries older than the TTL are fetched again."""
+        monkeypatch.setattr(groups_service, "GROUP_CACHE_TTL", 0.0)
+
+        await get_group(GetGroupInput(group_id="backend"))
+        await get_group(GetGroupInput(group_id="backend"))
+
+        assert mock_rest_client.get_model_async.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sibling_namespaces_share_one_lookup(self, mock_rest_client):
+        """Test that repeated namespace lookups reuse the cached group."""
+        for _ in range(3):
+            group = await get_group_by_project_namespace(
+                GetGroupByProjectNamespaceInput(project_namespace="backend")
+            )
+        await get_group(GetGroupInput(group_id="backend"))
+
+        assert group.path == "backend"
+        assert mock_rest_client.get_model_async.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_label_changes_invalidate_group(self, mock_rest_client):
+        """Test that changing a group label drops the cached group."""
+        labels = GitLabLabelListResponse(items=[])
+        with patch("src.services.groups.list_group_labels", AsyncMock(return_value=labels)):
+            await get_group(GetGroupInput(group_id="backend", with_labels=True))
+
+        label = GitLabLabel(id=1, name="bug", color="#ff0000", text_color="#ffffff")
+        with patch("src.services.groups.labels.create_label", AsyncMock(return_value=label)):
+            await groups_service.create_group_label(
+                CreateLabelInput(group_id="backend", name="bug", color="#ff0000")
+            )
+
+        assert ("backend", True) not in groups_service._group_cache
+
+    @pytest.mark.asyncio
+    async def test_label_changes_invalidate_every_spelling(self, mock_rest_client):
+        """Test that a label change by numeric ID drops the group cached by path."""
+        mock_rest_client.get_model_async.return_value = GitLabGroup.model_validate(
+            {**GROUP_RESPONSE, "full_path": "parent/backend"}
+        )
+        await get_group(GetGroupInput(group_id="parent/backend"))
+
+        label = GitLabLabel(id=1, name="bug", color="#ff0000", text_color="#ffffff")
+        with patch("src.services.groups.labels.create_label", AsyncMock(return_value=label)):
+            await groups_service.create_group_label(
+                CreateLabelInput(group_id="1", name="bug", color="#ff0000")
+            )
+        await get_group(GetGroupInput(group_id="parent/backend"))
+
+        assert mock_rest_client.get_model_async.await_count == 2
+
+
+class TestGroupVisibility:
+    """Unit tests for group visibility validation."""
+
+    @pytest.mark.parametrize("visibility", VISIBILITY_LEVELS)
+    def test_accepts_known_levels(self, visibility):
+        """Test that every GitLab visibility level is accepted as a plain string."""
+        group = GitLabGroup.model_validate({**GROUP_RESPONSE, "visibility": visibility})
+
+        assert group.visibility == visibility
+
+    def test_rejects_unknown_level(self):
+        """Test that unknown visibility values fail validation."""
+        with pytest.raises(pydantic.ValidationError):
+            GitLabGroup.model_validate({**GROUP_RESPONSE, "visibility": "secret"})
+
+
+class TestGroupInputs:
+    """Unit tests for group input models."""
+
+    def test_inputs_are_immutable(self):
+        """Test that tool inputs cannot be changed after validation."""
+        input_model = ListGroupsInput(search="backend")
+
+        with pytest.raises(pydantic.ValidationError):
+            input_model.search = "frontend"
+
+    @pytest.mark.parametrize("path", ["backend", "api-dev", "team_2", "My.Team", "Foo", "_x"])
+    def test_accepts_gitlab_paths(self, path):
+        """Test that group paths GitLab allows are accepted."""
+        assert CreateGroupInput(name="Team", path=path).path == path
+
+    @pytest.mark.parametrize(
+        "path", ["", "-team", ".team", "my team", "parent/child", "repo.git", "feed.atom"]
+    )
+    def test_rejects_invalid_paths(self, path):
+        """Test that group paths GitLab refuses are rejected."""
+        with pytest.raises(pydantic.ValidationError):
+            CreateGroupInput(name="Team", path=path)
+        with pytest.raises(pydantic.ValidationError):
+            UpdateGroupInput(group_id="1", path=path)
@@ -0,0 +1,91 @@
+"""Unit tests for the ETag-aware HTTP transport (no API calls)."""
+
+import httpx
+import pytest
+
+from src.api.http_cache import ETagCacheTransport
+
+
+class TestETagCacheTransport:
+    """Unit tests for ETagCacheTransport."""
+
+    @pytest.fixture
+    def server(self):
+        """Fake GitLab endpoint that honours If-None-Match."""
+        state = {"etag": '"v1"', "body": b'{"id": 1}', "requests": []}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            state["requests"].append(request)
+            if request.headers.get("If-None-Match") == state["etag"]:
+                return httpx.Response(304, headers={"ETag": state["etag"]})
+            return httpx.Response(
+                200,
+                headers={"ETag": state["etag"], "Content-Type": "application/json"},
+                content=state["body"],
+            )
+
+        state["transport"] = httpx.MockTransport(handler)
+        return state
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_body_on_not_modified(self, server):
+        """Test that a 304 is answered with the previously cached body."""
+        transport = ETagCacheTransport(server["transport"])
+        async with httpx.AsyncClient(transport=transport) as client:
+            first = await client.get("https://gitlab.example.com/api/v4/projects/1")
+            second = await client.get("https://gitlab.example.com/api/v4/projects/1")
+
+        assert first.json() == {"id": 1}
+        assert second.status_code == 200
+        assert second.json() == {"id": 1}
+        assert "If-None-Match" not in server["requests"][0].headers
+        assert server["requests"][1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_refreshes_cache_when_resource_changes(self, server):
+        """Test that a changed resource replaces the cached entry."""
+        transport = ETagCacheTransport(server["transport"])
+        url = "https://gitlab.example.com/api/v4/projects/1"
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(url)
+            server["etag"], server["body"] = '"v2"', b'{"id": 2}'
+            changed = await client.get(url)
+            revalidated = await client.get(url)
+
+        assert changed.json() == {"id": 2}
+        assert revalidated.json() == {"id": 2}
+        assert server["requests"][2].headers["If-None-Match"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_query_parameters_are_part_of_cache_key(self, server):
+        """Test that different pages are cached independently."""
+        transport = ETagCacheTransport(server["transport"])
+        url = "https://gitlab.example.com/api/v4/projects"
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(url, params={"page": 1})
+            await client.get(url, params={"page": 2})
+
+        assert "If-None-Match" not in server["requests"][1].headers
+
+    @pytest.mark.asyncio
+    async def test_non_get_requests_bypass_cache(self, server):
+        """Test that writes are never conditional or cached."""
+        transport = ETagCacheTransport(server["transport"])
+        url = "https://gitlab.example.com/api/v4/projects/1"
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.put(url, json={"name": "x"})
+            await client.put(url, json={"name": "x"})
+
+        assert all("If-None-Match" not in r.headers for r in server["requests"])
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_entry(self, server):
+        """Test that the cache never grows past its capacity."""
+        transport = ETagCacheTransport(server["transport"], capacity=1)
+        base = "https://gitlab.example.com/api/v4/projects"
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get(f"{base}/1")
+            await client.get(f"{base}/2")
+            await client.get(f"{base}/1")
+
+        assert "If-None-Match" not in server["requests"][2].headers
@@ -0,0 +1,91 @@
+"""Unit tests for the merge requests service using mocks (no API calls)."""
+
+from unittest.mock import AsyncMock, patch
+
+import pydantic
+import pytest
+
+from src.schemas.merge_requests import (
+    ListMergeRequestsInput,
+    MergeRequestState,
+    UpdateMergeRequestInput,
+)
+from src.services.merge_requests import list_merge_requests, update_merge_request
+
+MR_RESPONSE = {
+    "id": 1,
+    "iid": 7,
+    "project_id": 3,
+    "title": "Fix login",
+    "state": "opened",
+    "target_branch": "main",
+    "source_branch": "fix",
+    "web_url": "https://gitlab.example.com/g/p/-/merge_requests/7",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+}
+
+
+class TestLabelParameters:
+    """Unit tests for how label filters and updates are sent to GitLab."""
+
+    @pytest.fixture
+    def mock_rest_client(self):
+        """Mock REST client for the merge requests service."""
+        with patch("src.services.merge_requests.gitlab_rest_client") as mock:
+            mock._encode_path_parameter.side_effect = lambda path: path.replace("/", "%2F")
+            mock.get_validated_async = AsyncMock(return_value=[])
+            mock.put_model_async = AsyncMock(return_value=MR_RESPONSE)
+            yield mock
+
+    def test_accepts_comma_separated_labels(self):
+        """Test that a comma-separated string is normalised into label names."""
+        input_model = ListMergeRequestsInput(project_path="g/p", labels=" bug, frontend ,")
+
+        assert input_model.labels == ("bug", "frontend")
+
+    def test_label_lists_become_tuples(self):
+        """Test that label lists are stored as hashable tuples."""
+        input_model = ListMergeRequestsInput(project_path="g/p", labels=["bug", "ui"])
+
+        assert input_model.labels == ("bug", "ui")
+        assert hash(input_model.labels)
+
+    @pytest.mark.asyncio
+    async def test_list_sends_comma_joined_labels(self, mock_rest_client):
+        """Test that label filters are sent as one comma-separated parameter."""
+        await list_merge_requests(ListMergeRequestsInput(project_path="g/p", labels=["bug", "ui"]))
+
+        params = mock_rest_client.get_validated_async.call_args.kwargs["params"]
+        assert params["labels"] == "bug,ui"
+
+    @pytest.mark.asyncio
+    async def test_update_sends_comma_joined_labels(self, mock_rest_client):
+        """Test that label updates are sent as comma-separated strings."""
+        await update_merge_request(
+            UpdateMergeRequestInput(project_path="g/p", mr_iid=7, add_labels=["a", "b"], remove_labels=["c"])
+        )
+
+        payload = mock_rest_client.put_model_async.call_args.kwargs["json_data"]
+        assert payload == {"add_labels": "a,b", "remove_labels": "c"}
+
+
+class TestStateFilter:
+    """Unit tests for the merge request state filter."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("state", ["merged", MergeRequestState.MERGED])
+    async def test_state_is_sent_as_plain_string(self, state):
+        """Test that strings and enum members both reach GitLab as the raw value."""
+        with patch("src.services.merge_requests.gitlab_rest_client") as mock:
+            mock.get_validated_async = AsyncMock(return_value=[])
+            await list_merge_requests(ListMergeRequestsInput(project_path="g/p", state=state))
+
+        params = mock.get_validated_async.call_args.kwargs["params"]
+        assert params["state"] == "merged"
+        assert type(params["state"]) is str
+
+    def test_rejects_unknown_state(self):
+        """Test that states outside GitLab's vocabulary fail validation."""
+        with pytest.raises(pydantic.ValidationError):
+            ListMergeRequestsInput(project_path="g/p", state="draft")
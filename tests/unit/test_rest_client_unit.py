@@ -0,0 +1,172 @@
+"""Unit tests for the GitLab REST client using a mock transport (no API calls)."""
+
+import asyncio
+
+import httpx
+import pydantic
+import pytest
+
+from src.api.custom_exceptions import GitLabAPIError
+from src.schemas.base import list_adapter
+from src.schemas.groups import GitLabGroup
+from src.schemas.labels import GitLabLabel
+
+
+class TestRequestCoalescing:
+    """Unit tests for coalescing identical concurrent GET requests."""
+
+    @pytest.fixture
+    def server(self):
+        """Fake GitLab endpoint that blocks until released."""
+        state = {"calls": [], "release": asyncio.Event(), "status": 200}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            state["calls"].append(request)
+            await state["release"].wait()
+            return httpx.Response(state["status"], json={"path": request.url.path})
+
+        state["handler"] = handler
+        return state
+
+    @pytest.fixture
+    def rest_client(self, server, make_rest_client):
+        """REST client wired to the fake endpoint."""
+        return make_rest_client(server["handler"])
+
+    async def _gather_released(self, server, *coros):
+        """Start the calls together, then let the fake endpoint answer."""
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        await asyncio.sleep(0)
+        server["release"].set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_gets_share_one_request(self, server, rest_client):
+        """Test that concurrent GETs for the same resource hit the network once."""
+        results = await self._gather_released(
+            server,
+            rest_client.get_async("/projects/1", {"statistics": True}),
+            rest_client.get_async("/projects/1", {"statistics": True}),
+        )
+
+        assert len(server["calls"]) == 1
+        assert results[0] == results[1] == {"path": "/api/v4/projects/1"}
+        assert results[0] is not results[1]
+        assert rest_client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self, server, rest_client):
+        """Test that requests with different query parameters stay separate."""
+        await self._gather_released(
+            server,
+            rest_client.get_async("/projects", {"page": 1}),
+            rest_client.get_async("/projects", {"page": 2}),
+        )
+
+        assert len(server["calls"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_delivered_to_every_caller(self, server, rest_client):
+        """Test that a failed shared request raises for all waiting callers."""
+        server["status"] = 404
+        results = await self._gather_released(
+            server,
+            rest_client.get_async("/projects/1"),
+            rest_client.get_async("/projects/1"),
+        )
+
+        assert len(server["calls"]) == 1
+        assert all(isinstance(result, GitLabAPIError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_not_coalesced(self, server, rest_client):
+        """Test that completed requests are not reused by later callers."""
+        server["release"].set()
+        await rest_client.get_async("/projects/1")
+        await rest_client.get_async("/projects/1")
+
+        assert len(server["calls"]) == 2
+
+
+class TestGetModel:
+    """Unit tests for validating GET responses straight into models."""
+
+    @pytest.fixture
+    def rest_client(self, make_rest_client):
+        """REST client answering with a fixed label."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={"id": 1, "name": "bug", "color": "#f00", "text_color": "#fff", "extra": 1},
+            )
+
+        return make_rest_client(handler)
+
+    @pytest.mark.asyncio
+    async def test_returns_validated_model(self, rest_client):
+        """Test that the JSON body is validated into the requested model."""
+        label = await rest_client.get_model_async("/projects/1/labels/1", GitLabLabel)
+
+        assert isinstance(label, GitLabLabel)
+        assert label.name == "bug"
+
+    @pytest.mark.asyncio
+    async def test_mismatched_body_raises_validation_error(self, rest_client):
+        """Test that a body not matching the model fails validation."""
+        with pytest.raises(pydantic.ValidationError):
+            await rest_client.get_model_async("/projects/1/labels/1", GitLabGroup)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["post_model_async", "put_model_async"])
+    async def test_write_responses_are_validated(self, rest_client, method):
+        """Test that POST and PUT responses are validated into the requested model."""
+        label = await getattr(rest_client, method)("/projects/1/labels", GitLabLabel, {"name": "bug"})
+
+        assert isinstance(label, GitLabLabel)
+        assert label.color == "#f00"
+
+    @pytest.mark.asyncio
+    async def test_validates_lists_with_adapter(self, make_rest_client):
+        """Test that a list adapter validates a JSON array response."""
+        rest_client = make_rest_client(
+            lambda request: httpx.Response(
+                200,
+                json=[{"id": i, "name": f"l{i}", "color": "#f00", "text_color": "#fff"} for i in range(3)],
+            )
+        )
+
+        labels = await rest_client.get_validated_async(
+            "/projects/1/labels", list_adapter(GitLabLabel)
+        )
+
+        assert [label.id for label in labels] == [0, 1, 2]
+
+
+class TestJsonBody:
+    """Unit tests for encoding POST and PUT request bodies."""
+
+    @pytest.fixture
+    def sent(self):
+        """Requests captured by the fake endpoint."""
+        return []
+
+    @pytest.fixture
+    def rest_client(self, sent, make_rest_client):
+        """REST client that records requests and echoes an empty object."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(201, json={})
+
+        return make_rest_client(handler)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["post_async", "put_async"])
+    async def test_sends_compact_utf8_json(self, rest_client, sent, method):
+        """Test that bodies are sent as compact UTF-8 JSON with a JSON content type."""
+        await getattr(rest_client, method)("/projects/1/labels", {"name": "größe", "priority": None})
+
+        assert sent[0].content == '{"name":"größe","priority":null}'.encode()
+        assert sent[0].headers["Content-Type"] == "application/json"
+        assert sent[0].headers["PRIVATE-TOKEN"] == "test-token"
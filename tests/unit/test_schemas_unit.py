@@ -0,0 +1,208 @@
+"""Unit tests for the lazily populated src.schemas package."""
+
+import subprocess
+import sys
+
+import pydantic
+import pytest
+
+import src.schemas
+from src.schemas.base import (
+    GitLabInputBase,
+    GitLabResponseBase,
+    GitLabUserRef,
+    list_adapter,
+)
+from src.schemas.commits import GitLabCommitDetail
+from src.schemas.iterations import GitLabIteration, ListIterationsInput
+from src.schemas.merge_requests import GitLabMergeRequest
+from src.schemas.milestones import (
+    GetMilestoneInput,
+    GitLabMilestone,
+    ListMilestonesInput,
+)
+from src.schemas.search import (
+    IssueSearchResult,
+    MergeRequestSearchResult,
+    NoteSearchResult,
+    SearchResult,
+)
+
+
+class TestLazyExports:
+    """Unit tests for on-demand schema submodule imports."""
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing the package alone builds no schema modules."""
+        code = (
+            "import sys, src.schemas; "
+            "print(sorted(m for m in sys.modules if m.startswith('src.schemas.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_attribute_access_returns_submodule_object(self):
+        """Test that exported names resolve to the defining module's objects."""
+        assert src.schemas.GitLabCommitDetail is GitLabCommitDetail
+        assert "GitLabCommitDetail" in dir(src.schemas)
+
+    def test_every_exported_name_resolves(self):
+        """Test that __all__ lists only names the submodules define."""
+        for name in src.schemas.__all__:
+            assert getattr(src.schemas, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = src.schemas.DoesNotExist
+
+
+class TestDeferredBuild:
+    """Unit tests for deferred validator construction on response models."""
+
+    def test_schema_is_built_on_first_validation(self):
+        """Test that response models build their validator lazily."""
+
+        class Deferred(GitLabResponseBase):
+            id: int
+
+        assert not Deferred.__pydantic_complete__
+        assert Deferred.model_validate({"id": 1}).id == 1
+        assert Deferred.__pydantic_complete__
+
+    @pytest.mark.parametrize(
+        "model", [GitLabMergeRequest, GitLabMilestone, GitLabIteration, SearchResult]
+    )
+    def test_response_models_share_base_config(self, model):
+        """Test that response models inherit the shared response configuration."""
+        assert issubclass(model, GitLabResponseBase)
+        assert model.model_config["frozen"] and model.model_config["defer_build"]
+
+    def test_all_tool_inputs_share_input_base(self):
+        """Test that every *Input model uses the frozen, deferred input configuration."""
+        inputs = [
+            getattr(src.schemas, name) for name in src.schemas.__all__ if name.endswith("Input")
+        ]
+
+        assert inputs
+        for model in inputs:
+            assert issubclass(model, GitLabInputBase), model.__name__
+
+
+class TestSharedFields:
+    """Unit tests for the shared annotated field types."""
+
+    def test_descriptions_and_defaults_are_kept(self):
+        """Test that shared fields keep their description and per-model default."""
+        properties = GetMilestoneInput.model_json_schema()["properties"]
+
+        assert properties["group_id"]["description"] == "The numeric ID or path of the group"
+        assert properties["group_id"]["default"] is None
+        assert GetMilestoneInput(milestone_id=1).group_id is None
+
+
+class TestStateFilters:
+    """Unit tests for fixed-vocabulary state filters on list inputs."""
+
+    def test_accepts_documented_states(self):
+        """Test that the documented state values are accepted."""
+        assert ListMilestonesInput(group_id="team", state="active").state == "active"
+        assert ListIterationsInput(group_id="team", state="current").state == "current"
+
+    @pytest.mark.parametrize(
+        ("model", "state"), [(ListMilestonesInput, "opened"), (ListIterationsInput, "active")]
+    )
+    def test_rejects_unknown_states(self, model, state):
+        """Test that states outside the vocabulary fail validation."""
+        with pytest.raises(pydantic.ValidationError):
+            model(group_id="team", state=state)
+
+    def test_search_result_states_are_not_restricted(self):
+        """Test that search results keep whatever state GitLab reports."""
+        merge_request = {
+            "iid": 1,
+            "title": "Feature",
+            "id": 10,
+            "project_id": 2,
+            "state": "merged",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "web_url": "https://x/merge_requests/1",
+        }
+
+        assert MergeRequestSearchResult.model_validate(merge_request).state == "merged"
+        assert IssueSearchResult.model_validate(merge_request).state == "merged"
+
+
+class TestListAdapter:
+    """Unit tests for the cached list TypeAdapter helper."""
+
+    def test_adapter_is_cached_per_model(self):
+        """Test that each model gets one shared adapter."""
+        assert list_adapter(GitLabCommitDetail) is list_adapter(GitLabCommitDetail)
+
+    def test_validates_items_into_models(self):
+        """Test that raw dicts are validated into model instances."""
+        commits = list_adapter(GitLabCommitDetail).validate_python([
+            {
+                "id": "a" * 40,
+                "short_id": "aaaaaaaa",
+                "title": "Init",
+                "message": "Init",
+                "created_at": "2024-01-01T00:00:00Z",
+            }
+        ])
+
+        assert isinstance(commits[0], GitLabCommitDetail)
+        assert commits[0].short_id == "aaaaaaaa"
+
+
+class TestGitLabUserRef:
+    """Unit tests for the typed user reference model."""
+
+    def test_accepts_rest_and_graphql_keys(self):
+        """Test that snake_case REST and camelCase GraphQL users both parse."""
+        rest = GitLabUserRef.model_validate({"id": 1, "username": "jdoe", "web_url": "https://x/jdoe"})
+        graphql = GitLabUserRef.model_validate(
+            {"id": "gid://gitlab/User/1", "username": "jdoe", "webUrl": "https://x/jdoe"}
+        )
+
+        assert rest.web_url == graphql.web_url == "https://x/jdoe"
+        assert graphql.id == "gid://gitlab/User/1"
+
+    def test_search_result_author_is_typed(self):
+        """Test that embedded users become models and unknown keys are dropped."""
+        note = NoteSearchResult.model_validate({
+            "id": 1,
+            "body": "LGTM",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "author": {"id": 7, "username": "jdoe", "name": "J Doe", "locked": False},
+        })
+
+        assert isinstance(note.author, GitLabUserRef)
+        assert note.author.username == "jdoe"
+        assert "locked" not in note.model_dump()["author"]
+
+    def test_empty_search_collections_default_to_tuples(self):
+        """Test that missing labels and assignees default to immutable empty tuples."""
+        issue = IssueSearchResult.model_validate({
+            "iid": 1,
+            "title": "Bug",
+            "id": 10,
+            "project_id": 2,
+            "state": "opened",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "web_url": "https://x/issues/1",
+        })
+        labelled = IssueSearchResult.model_validate({
+            **issue.model_dump(), "labels": ["bug"], "assignees": [{"id": 7, "username": "jdoe"}]
+        })
+
+        assert issue.labels == issue.assignees == ()
+        assert labelled.labels == ("bug",)
+        assert labelled.model_dump(mode="json")["assignees"][0]["username"] == "jdoe"
@@ -0,0 +1,38 @@
+"""Unit tests for the search service using mocks (no API calls)."""
+
+import logging
+
+from src.schemas.search import SearchScope
+from src.services.search import _parse_search_results
+
+ISSUE_RESULT = {
+    "iid": 1,
+    "title": "Feature",
+    "id": 10,
+    "project_id": 2,
+    "state": "opened",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "web_url": "https://gitlab.example.com/group/project/-/issues/1",
+}
+
+
+class TestParseSearchResults:
+    """Unit tests for _parse_search_results function."""
+
+    def test_keeps_unknown_states(self):
+        """Test that states outside the documented vocabulary are not dropped."""
+        results = _parse_search_results([{**ISSUE_RESULT, "state": "all"}], SearchScope.ISSUES)
+
+        assert [result.state for result in results] == ["all"]
+
+    def test_logs_invalid_items_instead_of_printing(self, caplog, capsys):
+        """Test that unparseable items are logged without writing to stdout."""
+        with caplog.at_level(logging.WARNING, logger="src.services.search"):
+            results = _parse_search_results(
+                [ISSUE_RESULT, {"title": "no iid"}], SearchScope.ISSUES
+            )
+
+        assert [result.iid for result in results] == [1]
+        assert "Failed to parse search result item" in caplog.text
+        assert capsys.readouterr().out == ""
@@ -7,6 +7,7 @@ without making actual GitLab API requests.
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from src.api.custom_exceptions import GitLabAPIError, GitLabErrorType
 from src.schemas.work_items import (
@@ -15,6 +16,8 @@ from src.schemas.work_items import (
     GetWorkItemInput,
     ListWorkItemsInput,
     UpdateWorkItemInput,
+    WorkItemHierarchyWidget,
+    WorkItemLabelsWidget,
     WorkItemState,
     WorkItemType,
 )
@@ -675,6 +678,11 @@ class TestUpdateWorkItem:
         mutation_input = call_args[0][1]["input"]
         assert mutation_input["stateEvent"] == "REOPEN"  # Converted to uppercase
 
+    def test_update_work_item_rejects_unknown_state_event(self):
+        """Test that state events outside GitLab's vocabulary fail validation."""
+        with pytest.raises(ValidationError):
+            UpdateWorkItemInput(id="gid://gitlab/WorkItem/123", state_event="delete")
+
     @pytest.mark.asyncio
     async def test_update_work_item_confidential_false(self, mock_graphql_client, sample_update_response):
         """Test setting confidential to False explicitly."""
@@ -962,3 +970,22 @@ class TestWorkItemHelperFunctions:
 
         assert exc_info.value.error_type == GitLabErrorType.REQUEST_FAILED
         assert "Work item creation returned no data" in str(exc_info.value)
+
+
+class TestWidgetReferences:
+    """Unit tests for the typed references held by work item widgets."""
+
+    def test_hierarchy_keeps_selected_fields_only(self):
+        """Test that parent and children validate against the selected GraphQL fields."""
+        widget = WorkItemHierarchyWidget.model_validate({
+            "parent": {"id": "gid://gitlab/WorkItem/1", "iid": "1", "title": "Epic", "extra": True},
+            "children": [{"id": "gid://gitlab/WorkItem/2", "iid": "2", "workItemType": {"name": "Task"}}],
+        })
+
+        assert widget.parent == {"id": "gid://gitlab/WorkItem/1", "iid": "1", "title": "Epic"}
+        assert widget.children[0]["workItemType"]["name"] == "Task"
+
+    def test_labels_reject_wrong_types(self):
+        """Test that label references are type-checked during validation."""
+        with pytest.raises(ValueError):
+            WorkItemLabelsWidget.model_validate({"labels": [{"id": "gid://gitlab/Label/1", "title": 5}]})